@@ -1,20 +1,110 @@
+import logging
+import re
+import sys
 import json
-import csv
-import os
-from typing import List, Dict, Any
+import time
+import atexit
+from collections import deque
+from typing import List, Dict, Any, Tuple, Callable, FrozenSet, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# --- Optional accelerated JSON encoder (falls back to the standard library) ---
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _encode_json_line(record: Dict[str, Any]) -> bytes:
+    """Encodes a record as one compact, newline-terminated JSON Lines entry."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def _decode_json_line(line: bytes) -> Dict[str, Any]:
+    """Decodes one JSON Lines entry written by _encode_json_line."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+# --- Specialized CSV cell formatting (QUOTE_MINIMAL-compatible with csv.writer) ---
+_CSV_NEEDS_QUOTING = re.compile(r'[",\r\n]').search
+_CSV_QUOTE_ESCAPE = str.maketrans({'"': '""'})
+_CSV_LINE_TERMINATOR: str = "\r\n"
+
+
+def _format_text_cell(value: Any) -> str:
+    """Formats a cell, quoting it only if it contains a delimiter, quote or line break."""
+    if not isinstance(value, str):
+        value = "" if value is None else str(value)
+    if _CSV_NEEDS_QUOTING(value):
+        return '"' + value.translate(_CSV_QUOTE_ESCAPE) + '"'
+    return value
+
+
+def _format_number_cell(value: Any) -> str:
+    """Fast path for numeric columns: ints and floats never need quoting."""
+    if value.__class__ is int or value.__class__ is float:
+        return repr(value)
+    return _format_text_cell(value)
+
+
+# Interned reward chain names. Blocks intern their REWARD_CHAIN at stamp time, so
+# the dispatch lookup below is resolved by identity rather than string comparison.
+_BTZ: str = sys.intern("BTZCY-SYSTEM")
+_SDB: str = sys.intern("@SNIFFEE-DEBUGEE")
+
+# --- Per-reward-chain flatteners for the trailing ledger columns ---
+# Each returns (SDB_SEEDFRAME, BTZ_CHALLENGE_ID, BTZ_EXPIRY_TIMESTAMP, 
+#               BTZ_PACKETS_TOTAL, BTZ_LATENCY_AVG) for one block.
+
+def _flatten_btz(block: Dict[str, Any]) -> Tuple[Any, ...]:
+    """BTZ (Token 2): data is nested under the 'proof_data' and 'ethical_challenge' keys."""
+    proof_data = block.get('PROOF_DATA', {})
+    traffic = proof_data.get('traffic_data', {})
+    challenge = block.get('ETHICAL_CHALLENGE', {})
+    return (
+        "",
+        challenge.get("challenge_id", ""),
+        challenge.get("expiry_timestamp", 0),
+        traffic.get("total_packet_count", 0),
+        traffic.get("simulated_latency_ms", 0.0),
+    )
+
+
+def _flatten_sdb(block: Dict[str, Any]) -> Tuple[Any, ...]:
+    """SDB (Token 1): the seedframe is the block's main seed factor."""
+    return (block.get("SEEDFRAME", ""), "", "", "", "")
+
+
+def _flatten_noop(block: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Unknown reward chains leave every token-specific column empty."""
+    return ("", "", "", "", "")
+
 
 class DataLoggerOutput:
     """
     Manages the persistent archival of the blockchain to two distinct formats:
     1. A structured CSV ledger for high-speed statistical analysis.
-    2. A complete JSON log for deep auditing of nested cryptographic and ethical proofs.
+    2. An append-only JSON Lines log (one block per line) for deep auditing of 
+       nested cryptographic and ethical proofs.
     
     This class handles the complexity of flattening nested dictionary structures for 
     the CSV output while retaining full fidelity in the JSON output.
     """
 
     JSON_FILEPATH: str = "blockchain_audit_log.json"
+    JSONL_FILEPATH: str = "blockchain_audit_log.jsonl"
     CSV_FILEPATH: str = "blockchain_ledger.csv"
+
+    # CSV rows are buffered and written in batches: every BATCH_SIZE rows, or once
+    # FLUSH_INTERVAL_SECONDS have passed since the last flush (interactive mining).
+    BATCH_SIZE: int = 512
+    FLUSH_INTERVAL_SECONDS: float = 5.0
     
     # Core fields that must always be present in the CSV ledger
     CSV_CORE_FIELDNAMES: List[str] = [
@@ -40,85 +130,170 @@ class DataLoggerOutput:
         "BTZ_LATENCY_AVG"
     ]
 
+    # Columns copied straight from the block, aligned with the leading ledger 
+    # columns (all core fields plus BINARY-TRANSIT-NO). Missing keys produce an 
+    # empty cell, matching the previous DictWriter restval.
+    _DIRECT_FIELDNAMES: Tuple[str, ...] = tuple(CSV_CORE_FIELDNAMES + CSV_FLATTENED_FIELDNAMES[:1])
+
+    # Columns that hold numbers (or an empty cell) and take the unquoted fast path
+    CSV_NUMERIC_FIELDNAMES: FrozenSet[str] = frozenset([
+        "BLOCK_INDEX",
+        "TIMESTAMP",
+        "REWARD_AMOUNT",
+        "COMPLEXITY_LEVEL",
+        "BINARY-TRANSIT-NO",
+        "BTZ_EXPIRY_TIMESTAMP",
+        "BTZ_PACKETS_TOTAL",
+        "BTZ_LATENCY_AVG"
+    ])
+
+    # Block key under which the stamping engine caches the projected ledger row. 
+    # It is consumed (popped) by log_block and never reaches the JSONL audit log.
+    FLAT_ROW_KEY: str = "_FLAT"
+
+    # Dispatch table from REWARD_CHAIN to the flattener of the remaining columns.
+    # New reward chains are supported by registering a flattener here.
+    _FLATTENERS: Dict[str, Callable[[Dict[str, Any]], Tuple[Any, ...]]] = {
+        _BTZ: _flatten_btz,
+        _SDB: _flatten_sdb,
+    }
+
     def __init__(self):
-        """Initializes the logger, ensuring the necessary files are available."""
+        """
+        Initializes the logger and opens both ledger files once. The handles are 
+        kept for the lifetime of the logger, so each block write avoids the 
+        open/close/stat triad.
+        """
         self.csv_fieldnames = self.CSV_CORE_FIELDNAMES + self.CSV_FLATTENED_FIELDNAMES
 
-    def _flatten_block_data(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        # One formatter per column, resolved once for the fixed ledger schema
+        self._cell_formatters: Tuple[Callable[[Any], str], ...] = tuple(
+            _format_number_cell if name in self.CSV_NUMERIC_FIELDNAMES else _format_text_cell
+            for name in self.csv_fieldnames
+        )
+
+        self._csv_fh = open(self.CSV_FILEPATH, 'a', newline='', buffering=1 << 16)
+        # Append mode positions the handle at the end: an offset of 0 means a new/empty ledger
+        if self._csv_fh.tell() == 0:
+            self._csv_fh.write(
+                ",".join(map(_format_text_cell, self.csv_fieldnames)) + _CSV_LINE_TERMINATOR
+            )
+
+        self._csv_buffer: List[Tuple[Any, ...]] = []
+        self._last_flush_time: float = time.monotonic()
+
+        self._jsonl_fh = open(self.JSONL_FILEPATH, 'ab', buffering=1 << 20)
+        atexit.register(self.close)
+
+    def flush(self) -> None:
+        """Writes any buffered CSV rows and flushes both ledger handles to disk."""
+        try:
+            if self._csv_buffer:
+                self._csv_fh.write("".join(map(self._format_csv_row, self._csv_buffer)))
+                self._csv_buffer.clear()
+            self._csv_fh.flush()
+            self._jsonl_fh.flush()
+        except IOError as e:
+            logger.error("Could not flush ledger files: %s", e)
+        self._last_flush_time = time.monotonic()
+
+    def close(self) -> None:
+        """Flushes pending rows and closes the cached ledger file handles (safe to call twice)."""
+        if self._csv_fh.closed:
+            return
+        self.flush()
+        for fh in (self._csv_fh, self._jsonl_fh):
+            fh.close()
+
+    def project_block_row(self, block: Dict[str, Any]) -> Tuple[Any, ...]:
         """
-        Extracts and flattens complex, nested block data into a single-level 
-        dictionary suitable for the CSV ledger.
+        Extracts and flattens complex, nested block data into a single row tuple 
+        ordered exactly like csv_fieldnames. The stamping engine calls this once 
+        per finalized block and caches the result under FLAT_ROW_KEY.
         """
-        flat_data = block.copy()
-        
-        # --- Handle BTZ (Token 2) Data Flattening ---
-        if block["REWARD_CHAIN"] == "BTZCY-SYSTEM":
-            # Data is nested under the 'proof_data' and 'ethical_challenge' keys
-            proof_data = block.get('PROOF_DATA', {})
-            traffic = proof_data.get('traffic_data', {})
-            challenge = block.get('ETHICAL_CHALLENGE', {})
-            
-            flat_data["BTZ_CHALLENGE_ID"] = challenge.get("challenge_id", "")
-            flat_data["BTZ_EXPIRY_TIMESTAMP"] = challenge.get("expiry_timestamp", 0)
-            flat_data["BTZ_PACKETS_TOTAL"] = traffic.get("total_packet_count", 0)
-            flat_data["BTZ_LATENCY_AVG"] = traffic.get("simulated_latency_ms", 0.0)
-            
-        # --- Handle SDB (Token 1) Data Flattening ---
-        elif block["REWARD_CHAIN"] == "@SNIFFEE-DEBUGEE":
-            # The SDB seedframe is the block's main seed factor
-            flat_data["SDB_SEEDFRAME"] = block.get("SEEDFRAME", "")
-
-        # Remove the complex nested fields from the dictionary before writing the CSV
-        for key in ['PROOF_DATA', 'ETHICAL_CHALLENGE', 'SOFT-ENCRYPTER', 'SEEDFRAME']:
-            flat_data.pop(key, None)
-            
-        return flat_data
-
-    def log_block(self, block: Dict[str, Any], full_chain: List[Dict[str, Any]]) -> None:
+        # Only the needed fields are read; no copy of the block is ever made
+        get = block.get
+        direct = tuple([get(key, "") for key in self._DIRECT_FIELDNAMES])
+        return direct + self._FLATTENERS.get(block["REWARD_CHAIN"], _flatten_noop)(block)
+
+    def _format_csv_row(self, row: Tuple[Any, ...]) -> str:
+        """Renders one projected row as a complete CSV line, bypassing the csv module."""
+        return ",".join([
+            format_cell(value) for format_cell, value in zip(self._cell_formatters, row)
+        ]) + _CSV_LINE_TERMINATOR
+
+    def log_block(self, block: Dict[str, Any]) -> None:
         """
-        Logs the new block to both the JSON log (full fidelity) and the CSV ledger (summary).
+        Logs the new block to both the JSONL log (full fidelity) and the CSV ledger (summary).
         """
-        # 1. Log to JSON (Audit Log)
-        self._log_to_json(full_chain)
+        # Take the row projected at stamp time (if any) out of the block, so the 
+        # audit log receives the slim block without copying it
+        flat_row = block.pop(self.FLAT_ROW_KEY, None)
+
+        # 1. Log to JSONL (Audit Log) - only the new block is appended
+        self._log_to_json(block)
         
         # 2. Log to CSV (Statistical Ledger)
-        self._log_to_csv(block)
+        self._log_to_csv(block, flat_row)
         
-        print(f"[{block['TIME']}] Logged Block {block['BLOCK_INDEX']} to JSON/CSV. Complexity: {block['COMPLEXITY_LEVEL']:.7f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[%s] Logged Block %s to JSON/CSV. Complexity: %.7f", 
+                        block['TIME'], block['BLOCK_INDEX'], block['COMPLEXITY_LEVEL'])
 
-    def _log_to_json(self, chain: List[Dict[str, Any]]) -> None:
-        """Writes the entire blockchain to the JSON audit log file."""
+    def _log_to_json(self, block: Dict[str, Any]) -> None:
+        """
+        Appends a single block as one line to the JSONL audit log.
+        Each call writes O(1) bytes, independent of the chain height.
+        """
+        line = _encode_json_line(block)
         try:
-            with open(self.JSON_FILEPATH, 'w') as f:
-                json.dump(chain, f, indent=4)
+            self._jsonl_fh.write(line)
         except IOError as e:
-            print(f"ERROR: Could not save JSON audit log file: {e}")
-
-    def _log_to_csv(self, block: Dict[str, Any]) -> None:
-        """Appends the flattened block data to the CSV ledger."""
-        
-        # Flatten the data structure to fit the CSV columns
-        flat_block = self._flatten_block_data(block)
-        
-        # Determine if the file exists and whether the header needs to be written
-        file_exists = os.path.exists(self.CSV_FILEPATH)
-        write_header = not file_exists or os.path.getsize(self.CSV_FILEPATH) == 0
+            logger.error("Could not save JSON audit log file: %s", e)
 
+    def export_audit_snapshot(self) -> None:
+        """
+        Compacts the JSONL audit log into a single human-readable JSON document.
+        This is an on-demand operation and is never invoked per block.
+        """
         try:
-            with open(self.CSV_FILEPATH, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.csv_fieldnames)
-                
-                if write_header:
-                    writer.writeheader()
-                
-                # Write the new block data
-                writer.writerow(flat_block)
+            self._jsonl_fh.flush()
+            with open(self.JSONL_FILEPATH, 'rb') as f:
+                chain = [_decode_json_line(line) for line in f if line.strip()]
+            # Both encoders write the same layout: 2-space indent, unescaped UTF-8
+            if orjson is not None:
+                snapshot = orjson.dumps(chain, option=orjson.OPT_INDENT_2)
+            else:
+                snapshot = json.dumps(chain, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(self.JSON_FILEPATH, 'wb') as f:
+                f.write(snapshot)
+        except IOError as e:
+            logger.error("Could not export JSON audit snapshot: %s", e)
 
+    def read_recent_blocks(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Reads back the newest `limit` blocks of the JSONL audit log, oldest first. 
+        Used once at startup to resume an existing chain; empty if none was logged.
+        """
+        try:
+            self._jsonl_fh.flush()
+            with open(self.JSONL_FILEPATH, 'rb') as f:
+                tail = deque((line for line in f if line.strip()), maxlen=limit)
         except IOError as e:
-            print(f"ERROR: Could not save CSV ledger file: {e}")
-        except ValueError as e:
-            # Handle cases where a row might not contain all fieldnames (should not happen with _flatten_block_data)
-            print(f"ERROR: CSV writing failed due to missing fields: {e}")
+            logger.error("Could not read JSON audit log file: %s", e)
+            return []
+        return [_decode_json_line(line) for line in tail]
+
+    def _log_to_csv(self, block: Dict[str, Any], flat_row: Optional[Tuple[Any, ...]] = None) -> None:
+        """Buffers the flattened block data and writes the batch to the CSV ledger when due."""
+        # Project the data structure onto the CSV columns, unless already done at stamp time
+        if flat_row is None:
+            flat_row = self.project_block_row(block)
+        self._csv_buffer.append(flat_row)
+
+        if (len(self._csv_buffer) >= self.BATCH_SIZE or
+                time.monotonic() - self._last_flush_time >= self.FLUSH_INTERVAL_SECONDS):
+            self.flush()
 
 # Note: This file is designed to be imported by block_stamping_engine.py 
 # (File 2) for integration into the main block stamping process.
@@ -1,7 +1,17 @@
+import logging
+import sys
 import hashlib
+import hmac
 import time
 import random
-from typing import List, Dict, Any, Optional
+import functools
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
+
+# Shared canonical block encoder (also used for the Hardcover-Cryption hash)
+from TOKEN_1_SNIFFEE.security_hasher import SecurityHasher
+
+logger = logging.getLogger(__name__)
+
 
 class WalletAddressHandler:
     """
@@ -10,11 +20,25 @@ class WalletAddressHandler:
     cryptographically tied to a verified wallet address.
     """
 
+    # Constant payload fragments, pre-encoded once at class load
+    ACCEPTANCE_PREFIX: bytes = b"ACCEPTANCE-"
+    FIELD_SEPARATOR: bytes = b"-"
+
+    # Number of leading hex characters of the payload hash carried by a signature
+    SIGNATURE_PREFIX_LENGTH: int = 5
+
     def __init__(self):
         """Initializes the handler, conceptually loading all known node public keys."""
-        # Conceptual database of connected node addresses and their public keys
-        self.registered_nodes: Dict[str, str] = self._load_initial_nodes()
-        print(f"[{time.ctime()}] Wallet Handler initialized with {len(self.registered_nodes)} conceptual nodes.")
+        self.hasher = SecurityHasher()
+
+        # Conceptual database of connected node addresses and their public keys.
+        # Addresses are interned at registration so membership checks compare by identity.
+        self.registered_nodes: Dict[str, str] = {
+            sys.intern(address): public_key 
+            for address, public_key in self._load_initial_nodes().items()
+        }
+        self._refresh_address_cache()
+        logger.info("[%s] Wallet Handler initialized with %d conceptual nodes.", time.ctime(), len(self.registered_nodes))
 
     def _load_initial_nodes(self) -> Dict[str, str]:
         """
@@ -32,9 +56,28 @@ class WalletAddressHandler:
         }
         return nodes
 
-    def get_all_active_addresses(self) -> List[str]:
-        """Returns the list of all currently registered and conceptual active wallet addresses."""
-        return list(self.registered_nodes.keys())
+    def _refresh_address_cache(self) -> None:
+        """
+        Rebuilds the cached address views. Must be called whenever 
+        registered_nodes changes.
+        """
+        self._address_list: Tuple[str, ...] = tuple(self.registered_nodes.keys())
+        self._address_set: FrozenSet[str] = frozenset(self._address_list)
+
+    def get_all_active_addresses(self) -> Tuple[str, ...]:
+        """Returns all currently registered and conceptual active wallet addresses (cached, immutable)."""
+        return self._address_list
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _expected_prefix(payload: str, prefix_length: int) -> bytes:
+        """
+        Computes the hash prefix a valid signature must carry for the payload, 
+        as ASCII bytes. Memoized, since the same acceptance payload is typically 
+        re-verified within the 5-minute window. Only the first 3 digest bytes are 
+        hex-encoded, which covers the 5-character prefix.
+        """
+        return hashlib.sha256(payload.encode()).digest()[:3].hex()[:prefix_length].encode()
 
     def verify_address_signature(self, address: str, payload: str, signature: str) -> bool:
         """
@@ -42,17 +85,23 @@ class WalletAddressHandler:
         to ensure the reward acceptance or transaction request came from the 
         legitimate owner of the wallet address.
         """
-        if address not in self.registered_nodes:
+        if address not in self._address_set:
             return False
 
         # In a real system: Use the public key (self.registered_nodes[address]) 
         # and a cryptographic library (e.g., ECDSA) to verify the signature against the payload.
         
         # Here, we simulate a verifiable hash match for integrity:
-        expected_hash_prefix = hashlib.sha256(payload.encode()).hexdigest()[:5]
+        prefix_length = self.SIGNATURE_PREFIX_LENGTH
+        expected_hash_prefix = self._expected_prefix(payload, prefix_length)
         
-        # The signature is "valid" if it includes the expected prefix and a random factor
-        is_valid = signature.startswith(expected_hash_prefix) and len(signature) > 10
+        # The signature is "valid" if it includes the expected prefix and a random factor.
+        # compare_digest keeps the prefix comparison constant-time. It only accepts 
+        # ASCII str, so the untrusted prefix is compared as bytes: any non-ASCII 
+        # (even lone surrogate) character simply fails to match.
+        signature_prefix = signature[:prefix_length].encode("utf-8", "surrogatepass")
+        is_valid = (len(signature) > 10 and 
+                    hmac.compare_digest(signature_prefix, expected_hash_prefix))
         
         return is_valid
 
@@ -60,12 +109,16 @@ class WalletAddressHandler:
         """
         [CRYPTOGRAPHIC SIGNING] Simulates the main node cryptographically signing 
         the block data before stamping, providing the final 'proof of authorization'.
-        """
-        # Create a standardized payload string from the block content
-        payload = str(block_data) 
         
-        # Use a complex hash based on the payload and the simulated private key
-        complex_hash = hashlib.sha512(f"{payload}-{private_key_sim}".encode()).hexdigest()
+        Only the fields in SecurityHasher.CANONICAL_BLOCK_FIELDS are signed (the 
+        same fields the Hardcover-Cryption hash covers). Any other key of 
+        `block_data`, such as nested proof data or the stamped hashes, is NOT 
+        covered by the signature.
+        """
+        # Use a complex hash based on the canonical block payload and the simulated private key
+        complex_hash = hashlib.sha512(b"".join([
+            self.hasher.canonical_bytes(block_data), self.FIELD_SEPARATOR, private_key_sim.encode()
+        ])).hexdigest()
         
         # The signature is the unique hash prefixed with an auth tag
         signature = f"AUTH_SIGNATURE_0x{complex_hash}"
@@ -78,10 +131,14 @@ class WalletAddressHandler:
         BTZ 'Human Ethical Choice' challenge reward within the 5-minute window.
         """
         # The signature binds the reward ID, the accepting node, and its private key
-        payload = f"ACCEPTANCE-{challenge_id}-{accepting_address}"
+        sep = self.FIELD_SEPARATOR
+        payload = b"".join([
+            self.ACCEPTANCE_PREFIX, challenge_id.encode(), sep, 
+            accepting_address.encode(), sep, private_key_sim.encode()
+        ])
         
         # Simulates a signature generation, relying on the private key for security
-        signature_hash = hashlib.sha256(f"{payload}-{private_key_sim}".encode()).hexdigest()
+        signature_hash = hashlib.sha256(payload).hexdigest()
         
         # The first 5 characters serve as the verification prefix for the main node
         return f"{signature_hash[:5]}_{signature_hash}"
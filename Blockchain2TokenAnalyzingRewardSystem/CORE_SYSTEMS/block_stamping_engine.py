@@ -1,43 +1,78 @@
+import logging
+import sys
 import hashlib
 import time
-import json
-import csv
-from typing import List, Dict, Any
+import functools
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Sequence, Union
 
 # --- Module for Cryptography (Used for block integrity and security layers) ---
 from    TOKEN_1_SNIFFEE.security_hasher import SecurityHasher
 
+logger = logging.getLogger(__name__)
+
+NS_PER_SECOND: int = 1_000_000_000
+
+
+@functools.lru_cache(maxsize=128)
+def _format_block_time(timestamp_s: int) -> str:
+    """
+    Formats a whole-second timestamp as ISO-8601. Cached, since blocks stamped 
+    in bulk (replay/bootstrap) share the same second.
+    """
+    return datetime.fromtimestamp(timestamp_s).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
+class BlockHeader:
+    """
+    The fixed-layout part of a stamped block that later blocks depend on: its 
+    position, hash and stamp time. Kept in memory in place of the full block 
+    dict, whose nested proof data only the audit log needs.
+    """
+    block_index: int
+    hardcover_cryption: str
+    timestamp: int  # ns since the epoch, as in the block's TIMESTAMP
+
+    @classmethod
+    def from_block(cls, block: Dict[str, Any]) -> "BlockHeader":
+        """Extracts the header of a stamped (or reloaded) block dict."""
+        return cls(block["BLOCK_INDEX"], block["HARDCOVER_CRYPTION"], block.get("TIMESTAMP", 0))
+
+
 class BlockStampingEngine:
     """
     Manages the creation, cryptographic stamping, and persistence of new blocks.
     It enforces the dual-cryption layers and handles the progressive complexity.
+
+    Persistence is delegated entirely to the DataLoggerOutput (File 11), which 
+    owns the JSONL audit log and the CSV ledger.
     """
-    
-    # Define file paths for persistence
-    LOG_FILEPATH: str = "blockchain_log.json"
-    CSV_FILEPATH: str = "blockchain_ledger.csv"
 
-    def __init__(self, chain: List[Dict[str, Any]], complexity: float):
-        """Initializes the engine with the current chain state and difficulty."""
+    def __init__(self, chain: Sequence[Union[Dict[str, Any], BlockHeader]], complexity: float, data_logger: Any = None):
+        """Initializes the engine with the current chain state, difficulty and block logger."""
         self.blockchain = chain
         self.current_complexity = complexity
         self.hasher = SecurityHasher()
+        self.data_logger = data_logger
 
     def update_complexity(self, new_complexity: float) -> None:
         """Updates the Progressive Eternity complexity factor."""
         self.current_complexity = new_complexity
         
-    def _get_last_block(self) -> Dict[str, Any]:
-        """Retrieves the last stamped block in the chain."""
+    def _get_last_block(self) -> BlockHeader:
+        """Retrieves the header of the last stamped block in the chain."""
         # Ensure the chain is not empty before attempting to access the last block
         if not self.blockchain:
             # Should be handled by main_node_runner creating the Genesis block, 
             # but this provides a safe fallback structure.
-            return {
-                "HARDCOVER_CRYPTION": self.hasher.placeholder_hash(), # 000...0
-                "BLOCK_INDEX": 0
-            }
-        return self.blockchain[-1]
+            return BlockHeader(0, self.hasher.placeholder_hash(), 0) # 000...0
+        last_block = self.blockchain[-1]
+        # The chain may hold full block dicts or just their headers
+        if isinstance(last_block, BlockHeader):
+            return last_block
+        return BlockHeader.from_block(last_block)
 
     def _prepare_block_data(
         self,
@@ -52,15 +87,15 @@ class BlockStampingEngine:
         """
         Assembles the core block data structure with all required logistical stamps.
         The 'TIME' and 'TIMESTAMP' stamps are separated for human readability and 
-        machine precision.
+        machine precision (integer nanoseconds since the epoch).
         """
-        timestamp_s = time.time()
+        timestamp_ns = time.time_ns()
         
         block = {
             # Core Chain Integrity
             "BLOCK_INDEX": index,
-            "TIME": time.ctime(timestamp_s),  # Human readable time stamp
-            "TIMESTAMP": timestamp_s,         # Machine precision timestamp
+            "TIME": _format_block_time(timestamp_ns // NS_PER_SECOND),  # Human readable ISO-8601 stamp
+            "TIMESTAMP": timestamp_ns,                                   # Machine precision timestamp (ns)
             "PREVIOUS_HASH": previous_hash,
             "COMPLEXITY_LEVEL": self.current_complexity, # Progressive Eternity factor
             
@@ -85,14 +120,22 @@ class BlockStampingEngine:
         reward_amount: int,
         binary_transit_no: int,
         seedframe: str = "0",
-        is_genesis: bool = False
+        is_genesis: bool = False,
+        parent_header: Optional[BlockHeader] = None
     ) -> Dict[str, Any]:
         """
         Stamps a complete, cryptographically secured new block onto the chain.
+        
+        `parent_header` is the header of the block to link to, so the caller 
+        never has to hand over the chain. Without it, the engine links to the 
+        tip of its own chain.
         """
-        last_block = self._get_last_block()
-        index = last_block["BLOCK_INDEX"] + 1
-        previous_hash = last_block["HARDCOVER_CRYPTION"]
+        # Interned, so downstream REWARD_CHAIN lookups hit the identity fast path
+        reward_type = sys.intern(reward_type)
+
+        last_block = parent_header if parent_header is not None else self._get_last_block()
+        index = last_block.block_index + 1
+        previous_hash = last_block.hardcover_cryption
         
         # 1. Prepare Block Data
         new_block = self._prepare_block_data(
@@ -105,9 +148,8 @@ class BlockStampingEngine:
             seedframe
         )
         
-        # 2. Apply Hardcover-Cryption (SHA-256 for integrity)
-        block_content_string = json.dumps(new_block, sort_keys=True)
-        hard_hash = self.hasher.sha256_hash(block_content_string)
+        # 2. Apply Hardcover-Cryption (SHA-256 over the canonical block bytes)
+        hard_hash = self.hasher.canonical_sha256_hash(new_block)
         new_block["HARDCOVER_CRYPTION"] = hard_hash
         
         # 3. Apply Constellation-Security Lock (Fictional/Conceptual SHA-4091 equivalent)
@@ -119,48 +161,22 @@ class BlockStampingEngine:
         )
         new_block["CONSTELLATION-SECURITY"] = constellation_lock
 
-        print(f"[{new_block['TIME']}] Block {index} Stamped. Reward: {reward_amount} {reward_type}")
+        # 4. Project the finalized block onto the ledger row once, in the same pass
+        if self.data_logger is not None:
+            new_block[self.data_logger.FLAT_ROW_KEY] = self.data_logger.project_block_row(new_block)
+
+        logger.info("[%s] Block %d Stamped. Reward: %s %s", new_block['TIME'], index, reward_amount, reward_type)
         return new_block
 
 
     def save_chain(self, chain: List[Dict[str, Any]]) -> None:
         """
-        Saves the complete blockchain state to both a JSON file for easy loading 
-        and a CSV ledger for infinite infinity stamping and analysis.
+        Persists the newest block of the blockchain (append-only) through the 
+        DataLoggerOutput, for both the JSONL audit log and the CSV ledger. 
+        Without a data logger there is nothing to persist to, as in stamp_new_block.
         """
-        # --- 1. JSON Persistence (Load/Save) ---
-        try:
-            with open(self.LOG_FILEPATH, 'w') as f:
-                json.dump(chain, f, indent=4)
-        except IOError as e:
-            print(f"ERROR: Could not save JSON log file: {e}")
-
-        # --- 2. CSV Persistence (Analytical Ledger) ---
-        if not chain:
-            return
-            
-        fieldnames = list(chain[0].keys())
-        
-        try:
-            # Append to CSV, but write header only if file is new/empty
-            file_exists = self.CSV_FILEPATH in [f.name for f in os.scandir('.')]
-            write_header = not file_exists or os.path.getsize(self.CSV_FILEPATH) == 0
-
-            with open(self.CSV_FILEPATH, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                if write_header:
-                    writer.writeheader()
-                    # If we write the header, we should write all blocks to ensure
-                    # integrity, or just the new block since the last save.
-                    # For simplicity, we write the entire chain to ensure sync.
-                    writer.writerows(chain)
-                else:
-                    # Only write the last block (the newest one)
-                    writer.writerow(chain[-1])
-
-        except IOError as e:
-            print(f"ERROR: Could not save CSV ledger file: {e}")
+        if chain and self.data_logger is not None:
+            self.data_logger.log_block(chain[-1])
 
 
 if __name__ == '__main__':
@@ -1,5 +1,6 @@
+import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 
 # --- Conceptual Modules (Imports for logical structure) ---
 # These modules will be generated in subsequent steps and contain the specific 
@@ -11,6 +12,9 @@ from TOKEN_1_SNIFFEE.sdb_reward_logic import SDBRewardLogic
 # BTZ Token (PACKET LOADING I/O & O/I SPEED VOLUME MINING)
 from TOKEN_2_BTZCY.btz_reward_logic import BTZRewardLogic
 
+logger = logging.getLogger(__name__)
+
+
 class ConsensusManager:
     """
     The intelligent hub coordinating the two distinct mining consensus mechanisms.
@@ -18,6 +22,15 @@ class ConsensusManager:
     and the 'favorite algorithm' and 'highest packet count' rules.
     """
 
+    # Fixed set of conceptual node addresses, built once at class load instead of
+    # materializing a new list on every consensus round.
+    SIMULATED_NODE_ADDRESSES: Tuple[str, ...] = (
+        "0xBTCZCY_ETHICAL_COMPUTATION_ADDRESS_7E3F",
+        "0xSNIF_HIGH_VALUE_NODE_A1B2",
+        "0xPACKET_LOAD_MASTER_C3D4",
+        "0xCONSTELLATION_MINER_X9Y0"
+    )
+
     def __init__(self, sdb_reward: int, btz_reward: int):
         """Initializes the consensus manager with reward amounts and sub-modules."""
         self.sdb_reward = sdb_reward
@@ -26,72 +39,78 @@ class ConsensusManager:
         # Initialize the specific reward logic handlers
         # NOTE: For deployment, these would interact with real P2P nodes. 
         # Here they handle simulated consensus.
-        self.sdb_logic = SniffRewardLogic(reward_amount=1500)
+        self.sdb_logic = SDBRewardLogic()
         self.btz_logic = BTZRewardLogic()
 
-    def _get_active_nodes(self) -> list[str]:
+    def _get_active_nodes(self) -> Tuple[str, ...]:
         """
         [CONCEPTUAL] Simulates obtaining a list of actively connected blockchain nodes.
         In a real P2P system, this would be a network discovery function.
         """
         # Using a fixed set of conceptual addresses for simulation purposes.
-        return [
-            "0xBTCZCY_ETHICAL_COMPUTATION_ADDRESS_7E3F",
-            "0xSNIF_HIGH_VALUE_NODE_A1B2",
-            "0xPACKET_LOAD_MASTER_C3D4",
-            "0xCONSTELLATION_MINER_X9Y0"
-        ]
+        return self.SIMULATED_NODE_ADDRESSES
 
-    def run_sdb_consensus(self) -> Optional[Dict[str, Any]]:
+    def run_sdb_consensus(self, active_nodes: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Executes the SDB Proof-of-Favorite-Sniffing (PoFS) consensus.
         
         The rules: Favorite algorithm of blockchain reward generated to node 
         at random by favorite at 1500 @SNIFFEE-DEBUGEE every 30 minutes 
         to random by favorite sniffing WIFI on nodes.
+        
+        `active_nodes` are the addresses competing this cycle (by default, the 
+        simulated node set).
         """
-        active_nodes = self._get_active_nodes()
+        if active_nodes is None:
+            active_nodes = self._get_active_nodes()
         
-        print("SDB Consensus: Analyzing 'Favorite Randomized Online Seed Transactions'...")
+        logger.info("SDB Consensus: Analyzing 'Favorite Randomized Online Seed Transactions'...")
         
         # Delegate the specific, complex reward logic to the SDB module
-        winner_data = self.sdb_logic.determine_favorite_winner(active_nodes)
+        winner_data = self.sdb_logic.run_sdb_consensus(active_nodes)
 
         if winner_data:
-            print(f"SDB Consensus Complete: {winner_data['winner_address']} wins {self.sdb_reward} SDB.")
+            logger.info("SDB Consensus Complete: %s wins %s SDB.", winner_data['winner_address'], self.sdb_reward)
             return {
                 "winner_address": winner_data["winner_address"],
+                "reward_type": winner_data["reward_type"], # @SNIFFEE-DEBUGEE
                 "reward_amount": self.sdb_reward,
+                "binary_transit_no": winner_data["binary_transit_no"],
                 "seedframe": winner_data["seedframe"]
             }
         
-        print("SDB Consensus: No winner matched the 'Favorite' seed this cycle.")
+        logger.info("SDB Consensus: No winner matched the 'Favorite' seed this cycle.")
         return None
 
-    def run_btz_consensus(self) -> Optional[Dict[str, Any]]:
+    def run_btz_consensus(self, active_nodes: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
         """
         Executes the BTZ Proof-of-Traffic-Volume (PoTV) consensus.
         
         The rules: Rewarded by highest I/O O/I packets sent and received, 
         verified by PING and NMAP. Highest traffic wins 150 BTZ every 5 minutes.
+        
+        `active_nodes` are the addresses competing this cycle (by default, the 
+        simulated node set).
         """
-        active_nodes = self._get_active_nodes()
+        if active_nodes is None:
+            active_nodes = self._get_active_nodes()
         
-        print("BTZ Consensus: Tracing and verifying I/O O/I Packet Volume...")
+        logger.info("BTZ Consensus: Tracing and verifying I/O O/I Packet Volume...")
         
         # Delegate the specific, complex reward logic to the BTZ module
-        winner_data = self.btz_logic.determine_highest_traffic_winner(active_nodes)
+        winner_data = self.btz_logic.run_btz_consensus(active_nodes)
         
         if winner_data:
-            print(f"BTZ Consensus Complete: {winner_data['winner_address']} wins {self.btz_reward} BTZ.")
+            logger.info("BTZ Consensus Complete: %s wins %s BTZ.", winner_data['winner_address'], self.btz_reward)
             return {
                 "winner_address": winner_data["winner_address"],
+                "reward_type": winner_data["reward_type"], # BTZCY-SYSTEM
                 "reward_amount": self.btz_reward,
-                "packet_count": winner_data["packet_count"],
+                "binary_transit_no": winner_data["binary_transit_no"],
                 "seedframe": winner_data["seedframe"] # Uses a transit seedframe
             }
         
-        print("BTZ Consensus: Network traffic analysis inconclusive or no nodes active.")
+        logger.info("BTZ Consensus: Network traffic analysis inconclusive or no nodes active.")
         return None
 
 if __name__ == '__main__':
@@ -99,9 +118,6 @@ if __name__ == '__main__':
     print("--- Consensus Manager Demonstration ---")
     manager = ConsensusManager(sdb_reward=1500, btz_reward=150)
     
-    # NOTE: This will fail until SniffRewardLogic and BTZRewardLogic are created.
-    # The intelligent response is to show the intended function.
-    
     try:
         # Conceptual call to SDB reward cycle
         sdb_result = manager.run_sdb_consensus() 
@@ -1,7 +1,13 @@
+import logging
+import os
 import time
-import random
+import secrets
+import struct
 import hashlib
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
 
 class FavoriteSeedGenerator:
     """
@@ -20,17 +26,27 @@ class FavoriteSeedGenerator:
         "DenseTopology_SCRAMBLE": 1.75,
         "RandomizedNoise_XOR": 2.0
     }
+
+    # Frozen selection order of the 'Favorite' keys (no per-call list allocation)
+    _FAVORITE_KEYS: Tuple[str, ...] = tuple(FAVORITE_ALGORITHM_FACTORS)
     
     # Target bit length for the complex binary computation proof (representing hash difficulty)
     TARGET_SEED_LENGTH: int = 64 # Length in hexadecimal characters (256 bits)
 
+    # Width of the hourly block time bucket used by the Constellation Lock Key
+    NS_PER_HOUR: int = 3600 * 10**9
+
     def __init__(self):
         """Initializes the generator and creates the first immutable seed frame."""
+        # Per-favorite invariant hash input, encoded once instead of on every seed
+        self._favorite_prefix: Dict[str, bytes] = {
+            key: (key + "-").encode('utf-8') for key in self.FAVORITE_ALGORITHM_FACTORS
+        }
         self._current_seed_frame: Dict[str, Any] = self._generate_new_seed_frame()
         
     def _select_random_favorite(self) -> str:
         """Picks one of the 'Favorite' algorithm types for the current reward cycle."""
-        return random.choice(list(self.FAVORITE_ALGORITHM_FACTORS.keys()))
+        return self._FAVORITE_KEYS[secrets.randbelow(len(self._FAVORITE_KEYS))]
 
     def _generate_complex_seed(self, favorite_key: str) -> str:
         """
@@ -39,36 +55,47 @@ class FavoriteSeedGenerator:
         """
         factor = self.FAVORITE_ALGORITHM_FACTORS[favorite_key]
         
-        # Input includes time, factor, and a high-entropy random component
-        complex_input = f"{favorite_key}-{time.time() * factor}-{random.getrandbits(128)}"
-        
-        # Use SHA-512 for a strong cryptographic core
-        complex_hash = hashlib.sha512(complex_input.encode('utf-8')).hexdigest()
+        # Use SHA-512 for a strong cryptographic core. Input includes the favorite, 
+        # the factor-scaled time, and a high-entropy random component (OS CSPRNG).
+        complex_hash = hashlib.sha512(self._favorite_prefix[favorite_key])
+        complex_hash.update(struct.pack('<d', time.time() * factor))
+        complex_hash.update(os.urandom(16))
         
-        # Truncate the hash to the target length to define the specific puzzle (Seed Transaction)
-        return complex_hash[:self.TARGET_SEED_LENGTH]
+        # Truncate the hash to the target length to define the specific puzzle (Seed Transaction).
+        # Two hex characters per byte: only the needed bytes are hex-encoded.
+        return complex_hash.digest()[:self.TARGET_SEED_LENGTH // 2].hex()
 
-    def _generate_constellation_lock_key(self, target_seed: str) -> str:
+    def _generate_constellation_lock_key(self, target_seed: str, seed_hasher: Optional[Any] = None) -> str:
         """
         Generates the 'Constellation Lock Key' as a secondary security measure. 
         This is a non-linear verification signature that ties the seed to the cycle time.
+
+        If a SHA-256 state that has already absorbed the seed is supplied, it is 
+        copied instead of re-hashing the seed from scratch.
         """
         # Scramble the seed with a time-based hash for uniqueness
-        scramble_input = f"{target_seed}-{int(time.time() / 3600)}" # Use hourly block time
-        return hashlib.sha256(scramble_input.encode('utf-8')).hexdigest()
+        if seed_hasher is not None:
+            scrambler = seed_hasher.copy()
+        else:
+            scrambler = hashlib.sha256(target_seed.encode('utf-8'))
+        scrambler.update(b"-%d" % (time.time_ns() // self.NS_PER_HOUR)) # Use hourly block time
+        return scrambler.hexdigest()
         
     def _generate_new_seed_frame(self) -> Dict[str, Any]:
         """Creates a complete new 'Favorite Randomized Online Seed Transaction'."""
         favorite_key = self._select_random_favorite()
         target_seed = self._generate_complex_seed(favorite_key)
+
+        # The frame ID and the lock key both start from SHA-256(seed): absorb it once
+        seed_hasher = hashlib.sha256(target_seed.encode('utf-8'))
         
         return {
             "seed_timestamp": int(time.time()),
-            "seed_frame_id": hashlib.sha256(target_seed.encode('utf-8')).hexdigest()[:16],
+            "seed_frame_id": seed_hasher.digest()[:8].hex(),
             "favorite_algorithm": favorite_key,
             "complexity_factor": self.FAVORITE_ALGORITHM_FACTORS[favorite_key],
             "target_seed_transaction": target_seed, # The immutable target hash
-            "constellation_lock_signature": self._generate_constellation_lock_key(target_seed)
+            "constellation_lock_signature": self._generate_constellation_lock_key(target_seed, seed_hasher)
         }
 
     def generate_favorite_seed(self) -> str:
@@ -82,4 +109,5 @@ class FavoriteSeedGenerator:
         Should only be called by the Consensus Manager after a successful SDB block stamp.
         """
         self._current_seed_frame = self._generate_new_seed_frame()
-        print(f"[{int(time.time())}] New SDB SeedFrame generated. Favorite: {self._current_seed_frame['favorite_algorithm']}")
\ No newline at end of file
+        logger.info("[%d] New SDB SeedFrame generated. Favorite: %s", 
+                    int(time.time()), self._current_seed_frame['favorite_algorithm'])
\ No newline at end of file
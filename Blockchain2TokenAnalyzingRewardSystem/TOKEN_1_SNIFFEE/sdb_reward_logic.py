@@ -1,5 +1,7 @@
+import logging
 import time
 import random
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 
 # Dependencies from other structural files (Knowing the Known)
@@ -8,6 +10,21 @@ from TOKEN_1_SNIFFEE.wifi_analyzer import ConceptualWifiAnalyzer # File 6 (Data
 # Assuming it is available for instantiation here.
 from TOKEN_1_SNIFFEE.favorite_seed_generator import FavoriteSeedGenerator 
 
+logger = logging.getLogger(__name__)
+
+
+class _TrieNode:
+    """
+    One level of the proof-hash prefix trie. Each node keeps a representative 
+    payload (the first node record inserted through it) for O(1) retrieval.
+    """
+    __slots__ = ("children", "payload")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.payload: Optional[Dict[str, Any]] = None
+
+
 class SDBRewardLogic:
     """
     Manages the Proof-of-Favorite-Seed (PoFS) consensus for the @SNIFFEE-DEBUGEE token.
@@ -29,23 +46,45 @@ class SDBRewardLogic:
         self.seed_generator = FavoriteSeedGenerator()
         self.last_reward_time = time.time()
 
-    def _find_seed_match_winner(self, eligible_nodes_data: List[Dict[str, Any]], target_seed: str) -> Optional[Dict[str, Any]]:
+    def _build_proof_trie(self, eligible_nodes_data: List[Dict[str, Any]]) -> _TrieNode:
+        """
+        Inserts every node's proof hash into a character trie, once per cycle. 
+        Only the first MATCH_DIFFICULTY_LENGTH characters are ever matched, so 
+        the trie stops at that depth.
         """
-        Iterates through node data proofs to find a match against the target seed prefix.
+        root = _TrieNode()
+        # Bind the invariants once, outside the per-node loop
+        depth = self.MATCH_DIFFICULTY_LENGTH
+        proof_of = itemgetter("data_proof_hash")
+        new_node = _TrieNode
+        for node_data in eligible_nodes_data:
+            node = root
+            for ch in proof_of(node_data)[:depth]:
+                children = node.children
+                child = children.get(ch)
+                if child is None:
+                    child = children[ch] = new_node()
+                    child.payload = node_data
+                node = child
+        return root
+
+    def _find_seed_match_winner(self, proof_trie: _TrieNode, target_seed: str) -> Optional[Dict[str, Any]]:
+        """
+        Descends the proof trie along the target seed prefix to find a matching node.
         This represents the core PoFS computational puzzle resolution.
         """
         match_prefix = target_seed[:self.MATCH_DIFFICULTY_LENGTH]
-        print(f"Target Seed Match Prefix: {match_prefix}")
+        logger.info("Target Seed Match Prefix: %s", match_prefix)
         
-        for node_data in eligible_nodes_data:
-            node_proof = node_data["data_proof_hash"]
-            
-            # Check for the prefix match
-            if node_proof.startswith(match_prefix):
-                print(f"SDB Match Found! Node {node_data['node_address']} aligns its hash with the Favorite Seed.")
-                return node_data
+        node = proof_trie
+        for ch in match_prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return None
         
-        return None
+        node_data = node.payload
+        logger.info("SDB Match Found! Node %s aligns its hash with the Favorite Seed.", node_data['node_address'])
+        return node_data
 
     def run_sdb_consensus(self, all_active_nodes: List[str]) -> Optional[Dict[str, Any]]:
         """
@@ -56,30 +95,33 @@ class SDBRewardLogic:
         """
         
         # 1. Time Gate: Ensure the 30-minute cycle has elapsed
-        if time.time() - self.last_reward_time < self.SDB_CYCLE_TIME_SECONDS:
+        # (one clock read serves the whole cycle)
+        now = time.time()
+        if now - self.last_reward_time < self.SDB_CYCLE_TIME_SECONDS:
              return None
         
         if not all_active_nodes:
             return None
 
-        print(f"\n--- SDB PoFS Consensus Active. Executing 30-min reward cycle. ---")
+        logger.info("--- SDB PoFS Consensus Active. Executing 30-min reward cycle. ---")
 
         # 2. Generate the Non-Linear Target Seed (File 9 Logic)
         target_seed = self.seed_generator.generate_favorite_seed()
-        print(f"Generated Favorite Randomized Online Seed: {target_seed}")
+        logger.info("Generated Favorite Randomized Online Seed: %s", target_seed)
 
         # 3. Aggregate Node Proofs (File 6 Logic)
-        eligible_nodes_data = self.analyzer.aggregate_all_node_traffic(all_active_nodes)
+        eligible_nodes_data = self.analyzer.aggregate_all_node_traffic(all_active_nodes, now)
+        proof_trie = self._build_proof_trie(eligible_nodes_data)
 
         # 4. Find the Winner (The PoFS Puzzle Resolver)
-        winner_data = self._find_seed_match_winner(eligible_nodes_data, target_seed)
+        winner_data = self._find_seed_match_winner(proof_trie, target_seed)
         
         if not winner_data:
-            print("SDB Consensus: No computational alignment found this cycle.")
+            logger.info("SDB Consensus: No computational alignment found this cycle.")
             return None
 
         # 5. Update timer and format block data
-        self.last_reward_time = time.time()
+        self.last_reward_time = now
         
         return {
             "winner_address": winner_data["node_address"],
@@ -1,6 +1,72 @@
 import hashlib
-import random
-from typing import Union
+import struct
+from typing import Union, Dict, Any, Tuple
+
+# Pre-compiled layouts for the canonical byte encoding: a one-byte type tag 
+# followed by a little-endian payload (or a 4-byte length for strings and 
+# integers beyond 64 bits).
+_TAGGED_BOOL = struct.Struct('<c?')
+_TAGGED_INT = struct.Struct('<cq')
+_TAGGED_FLOAT = struct.Struct('<cd')
+_TAGGED_LENGTH = struct.Struct('<cI')
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+# Soft-Encrypter XOR key, and its byte translation table. XOR with a key below 
+# 128 maps ASCII onto ASCII, so ASCII text can be encrypted in one C-level pass.
+_SOFT_ENCRYPT_KEY = 42 # Arbitrary fixed key for simplicity
+_SOFT_ENCRYPT_TABLE = bytes(b ^ _SOFT_ENCRYPT_KEY for b in range(256))
+
+
+def _encode_canonical_value(value: Any) -> bytes:
+    """
+    Encodes a single block field value into its canonical, type-tagged bytes. 
+    Every supported type has its own tag, so values of different types never 
+    collide (True is not 1, 2**64 is not "18446744073709551616"). Anything else 
+    is rejected rather than falling back to its str()/repr.
+    """
+    if value is None:
+        return b'n'
+    if isinstance(value, bool):  # before int: bool is an int subclass
+        return _TAGGED_BOOL.pack(b'b', value)
+    if isinstance(value, int):
+        if _INT64_MIN <= value <= _INT64_MAX:
+            return _TAGGED_INT.pack(b'i', value)
+        # Arbitrary precision: length-prefixed two's complement, little-endian
+        data = value.to_bytes(value.bit_length() // 8 + 1, 'little', signed=True)
+        return _TAGGED_LENGTH.pack(b'I', len(data)) + data
+    if isinstance(value, float):
+        return _TAGGED_FLOAT.pack(b'f', value)
+    if isinstance(value, str):
+        data = value.encode('utf-8')
+        return _TAGGED_LENGTH.pack(b's', len(data)) + data
+    raise TypeError(f"Cannot canonically encode a block field of type {type(value).__name__}")
+
+
+def _constellation_lock(hard_hash: str, complexity: float, reward_type: str, hash_length: int) -> str:
+    """
+    Simulates the computationally sophisticated SHA-4091 hash behind the 
+    Constellation-Security lock, incorporating 'CRYPTOGRAPHICALLY HUMAN ETHICAL CHOICES'.
+    
+    Note: SHA-4091 is fictional. This uses SHA-512 as a base to represent 
+    a stronger hash, then mixes it under a BLAKE2b key derived from the reward 
+    type. The lock is a pure function of its inputs, so a stamped block's lock 
+    can be recomputed to verify it.
+    """
+    # The seed for the lock combines the block's integrity hash, the
+    # escalating complexity, and the reward subject.
+    lock_seed = f"{hard_hash}-{complexity:.7f}-{reward_type}"
+    
+    # Step 1: Base cryptographic strength (Simulating the 4091 complexity)
+    base_hash = hashlib.sha512(lock_seed.encode('utf-8')).hexdigest()
+    
+    # Step 2: Keyed 'Human Ethical Choice' mix. BLAKE2b keys are capped at 64 
+    # bytes; the full reward type is already part of the seed.
+    constellation_hash = hashlib.blake2b(
+        base_hash.encode('utf-8'), key=reward_type.encode('utf-8')[:64], digest_size=64
+    ).hexdigest()[:hash_length]
+    
+    return f"CONSTELLATION_LOCK:{constellation_hash.upper()}"
+
 
 class SecurityHasher:
     """
@@ -13,6 +79,22 @@ class SecurityHasher:
     # Define placeholder for the fictional SHA-4091 output length 
     # (Using 128 characters for conceptual superiority over SHA-256's 64).
     CONSTELLATION_HASH_LENGTH: int = 128 
+
+    # Fixed order in which block fields are fed to the canonical encoder. 
+    # HARDCOVER_CRYPTION and CONSTELLATION-SECURITY are stamped after hashing.
+    CANONICAL_BLOCK_FIELDS: Tuple[str, ...] = (
+        "BLOCK_INDEX",
+        "TIME",
+        "TIMESTAMP",
+        "PREVIOUS_HASH",
+        "COMPLEXITY_LEVEL",
+        "WINNERS_ADDRESSES",
+        "REWARD_CHAIN",
+        "REWARD_AMOUNT",
+        "SEEDFRAME",
+        "BINARY-TRANSIT-NO",
+        "SOFT-ENCRYPTER",
+    )
     
     def sha256_hash(self, data: str) -> str:
         """
@@ -21,6 +103,24 @@ class SecurityHasher:
         """
         return hashlib.sha256(data.encode('utf-8')).hexdigest()
 
+    def canonical_bytes(self, block: Dict[str, Any]) -> bytes:
+        """
+        Returns the canonical byte encoding of a block: every field of 
+        CANONICAL_BLOCK_FIELDS in order, strings length-prefixed UTF-8 and numbers 
+        packed little-endian, so the stream does not depend on dict ordering. 
+        Built in a single join, without any intermediate JSON string. Fields 
+        must be None, bool, int, float or str (TypeError otherwise); keys outside 
+        CANONICAL_BLOCK_FIELDS are not part of the encoding.
+        """
+        return b"".join(map(_encode_canonical_value, map(block.get, self.CANONICAL_BLOCK_FIELDS)))
+
+    def canonical_sha256_hash(self, block: Dict[str, Any]) -> str:
+        """
+        Applies the 'Hardcover-Cryption' SHA-256 directly over the canonical 
+        byte encoding of the block, in a single hashlib call.
+        """
+        return hashlib.sha256(self.canonical_bytes(block)).hexdigest()
+
     def placeholder_hash(self) -> str:
         """Returns a string of zeros, representing the hash for the previous block of the Genesis Block."""
         return "0" * 64
@@ -30,32 +130,13 @@ class SecurityHasher:
         A simple, reversible encryption layer (Soft-Encrypter) using a light 
         XOR operation, intended for basic data obfuscation within the block.
         """
-        key = 42 # Arbitrary fixed key for simplicity
-        encrypted_chars = [chr(ord(char) ^ key) for char in data]
+        if data.isascii():
+            return data.encode('ascii').translate(_SOFT_ENCRYPT_TABLE).decode('ascii')
+        
+        # Non-ASCII text: XOR each code point individually
+        encrypted_chars = [chr(ord(char) ^ _SOFT_ENCRYPT_KEY) for char in data]
         return "".join(encrypted_chars)
     
-    def _fictional_sha4091_logic(self, seed: str) -> str:
-        """
-        Simulates the computationally sophisticated SHA-4091 hash, 
-        incorporating 'CRYPTOGRAPHICALLY HUMAN ETHICAL CHOICES'.
-        
-        Note: SHA-4091 is fictional. This uses SHA-512 as a base to represent 
-        a stronger hash, creatively extended with random factors to embody 
-        the Constellation-Security's non-deterministic complexity.
-        """
-        # Step 1: Base cryptographic strength (Simulating the 4091 complexity)
-        base_hash = hashlib.sha512(seed.encode('utf-8')).hexdigest()
-        
-        # Step 2: Incorporate 'Human Ethical Choice' (Conceptual randomization)
-        # This adds an element of non-reproducible complexity based on time
-        # and seed, making it a "constellation" of factors.
-        random.seed(int(time.time() * 1000) % 10000)
-        random_factor = format(random.getrandbits(64), 'x')
-        
-        # Step 3: Combine and re-hash to fit the required length
-        final_seed = base_hash + random_factor
-        return hashlib.sha512(final_seed.encode('utf-8')).hexdigest()[:self.CONSTELLATION_HASH_LENGTH]
-
     def constellation_lock_key(self, hard_hash: str, complexity: float, reward_type: str) -> str:
         """
         Applies the 'Constellation-Security' lock key, which conceptually 
@@ -65,14 +146,7 @@ class SecurityHasher:
         Input: hard_hash, current Progressive Eternity complexity, and reward type.
         Output: The unique Constellation Lock string.
         """
-        # The seed for the lock combines the block's integrity hash, the
-        # escalating complexity, and the reward subject.
-        lock_seed = f"{hard_hash}-{complexity:.7f}-{reward_type}"
-        
-        # The lock is generated using the conceptual SHA-4091 logic.
-        constellation_hash = self._fictional_sha4091_logic(lock_seed)
-        
-        return f"CONSTELLATION_LOCK:{constellation_hash.upper()}"
+        return _constellation_lock(hard_hash, complexity, reward_type, self.CONSTELLATION_HASH_LENGTH)
 
 
 if __name__ == '__main__':
@@ -1,41 +1,46 @@
 import random
 import hashlib
+import struct
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple, Optional
 from dataclasses import dataclass, field
 
-@dataclass
-class NetworkPacket:
-    """
-    Represents a single, highly detailed packet capture. 
-    This structure is the foundation of the 'mathematic degree' of complexity.
-    """
-    timestamp: float = field(default_factory=time.time)
-    source_mac: str = field(default_factory=lambda: f"00:1A:2B:{random.randint(0, 99):02X}:{random.randint(0, 99):02X}:{random.randint(0, 99):02X}")
-    destination_mac: str = field(default_factory=lambda: f"AA:BB:CC:{random.randint(0, 99):02X}:{random.randint(0, 99):02X}:{random.randint(0, 99):02X}")
-    protocol: str = field(default_factory=lambda: random.choice(['TCP', 'UDP', 'ICMP', 'ARP']))
-    payload_size_bytes: int = field(default_factory=lambda: random.randint(64, 1500))
-    # Simulated high-complexity metadata for 'sniffing' detail
-    sequence_number: int = field(default_factory=lambda: random.randint(10000, 99999))
-    ttl_hops_remaining: int = field(default_factory=lambda: random.randint(1, 64))
+# Pre-compiled binary layouts for the data proof hash input: the snapshot 
+# timestamp and packet count, then the sampled packet's payload size and 
+# sequence number.
+_PROOF_HEADER = struct.Struct("<dI")
+_PROOF_SAMPLE = struct.Struct("<II")
 
+# Sampling ranges for the simulated traffic (inclusive bounds, as randint had)
+_PACKET_COUNT_RANGE = range(100, 5001)
+_PAYLOAD_SIZE_RANGE = range(64, 1501)
+_SEQUENCE_NUMBER_RANGE = range(10000, 100000)
+_LATENCY_MIN_MS = 15.0
+_LATENCY_SPAN_MS = 120.0 - _LATENCY_MIN_MS
 
-@dataclass
+@dataclass(slots=True)
 class NodeTrafficSnapshot:
     """
     A full structured snapshot of traffic data for a single node, 
     used as input for the dual reward logic (SDB and BTZ).
+    
+    Only the packet counts and the one sampled packet that feeds the proof 
+    hash are kept; the individual captures are never read downstream. 
+    Slotted, so each snapshot carries no per-instance __dict__.
     """
     node_address: str
-    packets_in: List[NetworkPacket]
-    packets_out: List[NetworkPacket]
+    packets_in: int
+    packets_out: int
+    # Payload size and sequence number of the first inbound packet captured
+    sample_payload_size_bytes: int
+    sample_sequence_number: int
     simulated_latency_ms: float = field(default_factory=lambda: round(random.uniform(5.0, 150.0), 2))
     timestamp: float = field(default_factory=time.time)
 
     @property
     def total_packet_count(self) -> int:
         """Returns the total I/O O/I packet count (the PoTV measure)."""
-        return len(self.packets_in) + len(self.packets_out)
+        return self.packets_in + self.packets_out
 
     def generate_data_proof_hash(self) -> str:
         """
@@ -43,14 +48,15 @@ class NodeTrafficSnapshot:
         This hash is the basis for matching the 'Favorite Randomized Seed' (SDB) 
         and is included in the block stamp (BTZ).
         """
-        # Create a deterministically complex string from all core attributes
-        data_string = f"{self.node_address}-{self.timestamp}-{self.total_packet_count}"
-        
-        # Add complexity by mixing in a random packet's payload size and sequence number
-        if self.packets_in:
-            data_string += f"-{self.packets_in[0].payload_size_bytes}-{self.packets_in[0].sequence_number}"
-        
-        return hashlib.sha256(data_string.encode()).hexdigest()
+        # Pack the core attributes straight into bytes (no intermediate string),
+        # mixing in the sampled packet's payload size and sequence number. 
+        # BLAKE2b-256 keeps the 64-hex-character proof at a lower cost for 
+        # inputs this short.
+        return hashlib.blake2b(b"-".join([
+            self.node_address.encode(),
+            _PROOF_HEADER.pack(self.timestamp, self.total_packet_count),
+            _PROOF_SAMPLE.pack(self.sample_payload_size_bytes, self.sample_sequence_number),
+        ]), digest_size=32).hexdigest()
 
 
 class ConceptualWifiAnalyzer:
@@ -59,49 +65,59 @@ class ConceptualWifiAnalyzer:
     This class ensures the reward logic receives data of the required 'mathematic degree'.
     """
 
-    def _simulate_packet_capture(self, count: int) -> List[NetworkPacket]:
+    def _draw_traffic_columns(self, count: int) -> Iterator[Tuple[int, int, int, int, float]]:
         """
-        Simulates the intensive capture of structured packets. 
-        The complexity of the data object itself is the proof of work.
+        Draws every random value for `count` snapshots up front, one column at a 
+        time, and yields them per node as (packets_in, packets_out, payload size, 
+        sequence number, latency).
         """
-        return [NetworkPacket() for _ in range(count)]
+        choices = random.choices
+        rand = random.random
+        return zip(
+            choices(_PACKET_COUNT_RANGE, k=count),
+            choices(_PACKET_COUNT_RANGE, k=count),
+            choices(_PAYLOAD_SIZE_RANGE, k=count),
+            choices(_SEQUENCE_NUMBER_RANGE, k=count),
+            [round(_LATENCY_MIN_MS + _LATENCY_SPAN_MS * rand(), 2) for _ in range(count)],
+        )
 
-    def get_node_traffic_snapshot(self, node_address: str) -> NodeTrafficSnapshot:
+    def get_node_traffic_snapshot(self, node_address: str, now: Optional[float] = None) -> NodeTrafficSnapshot:
         """
         Generates a full traffic snapshot for a single node. 
         The packet count is randomized to simulate fluctuating network load.
         """
         # PoTV focus: Higher packet counts receive higher rewards
-        in_count = random.randint(100, 5000)
-        out_count = random.randint(100, 5000)
-        
-        packets_in = self._simulate_packet_capture(in_count)
-        packets_out = self._simulate_packet_capture(out_count)
-
         return NodeTrafficSnapshot(
-            node_address=node_address,
-            packets_in=packets_in,
-            packets_out=packets_out,
-            simulated_latency_ms=round(random.uniform(15.0, 120.0), 2)
+            node_address, *next(self._draw_traffic_columns(1)),
+            timestamp=time.time() if now is None else now
         )
 
-    def aggregate_all_node_traffic(self, node_addresses: List[str]) -> List[Dict[str, Any]]:
+    def iter_node_traffic(self, node_addresses: List[str], now: Optional[float] = None) -> Iterator[Dict[str, Any]]:
         """
-        Aggregates traffic snapshots for all active nodes for the consensus manager.
+        Lazily yields one traffic record per node address, in input order, so 
+        callers can consume the sweep without materializing it. All snapshots of 
+        one sweep share a single capture timestamp (`now`, or the current time 
+        when omitted).
         """
-        aggregated_data = []
-        for address in node_addresses:
-            snapshot = self.get_node_traffic_snapshot(address)
+        if now is None:
+            now = time.time()
+        for address, columns in zip(node_addresses, self._draw_traffic_columns(len(node_addresses))):
+            snapshot = NodeTrafficSnapshot(address, *columns, timestamp=now)
             
             # Return a simple dictionary suitable for block stamping and comparison
-            aggregated_data.append({
+            yield {
                 "node_address": address,
                 "data_proof_hash": snapshot.generate_data_proof_hash(),
                 "io_traffic_details": {
-                    "packets_in": len(snapshot.packets_in),
-                    "packets_out": len(snapshot.packets_out),
+                    "packets_in": snapshot.packets_in,
+                    "packets_out": snapshot.packets_out,
                     "total_packet_count": snapshot.total_packet_count,
                     "simulated_latency_ms": snapshot.simulated_latency_ms
                 }
-            })
-        return aggregated_data
+            }
+
+    def aggregate_all_node_traffic(self, node_addresses: List[str], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregates traffic snapshots for all active nodes for the consensus manager.
+        """
+        return list(self.iter_node_traffic(node_addresses, now))
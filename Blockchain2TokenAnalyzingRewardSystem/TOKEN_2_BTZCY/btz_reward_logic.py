@@ -1,3 +1,4 @@
+import logging
 import random
 import time
 import hashlib
@@ -7,6 +8,14 @@ from typing import List, Dict, Any, Optional
 from TOKEN_1_SNIFFEE.wifi_analyzer import ConceptualWifiAnalyzer # For data structure
 from TOKEN_2_BTZCY.ping_nmap_verifier import PingNmapVerifier # For integrity check
 
+logger = logging.getLogger(__name__)
+
+
+def _total_packet_count(node_data: Dict[str, Any]) -> int:
+    """Key extractor for the PoTV winner: the node's total I/O O/I packet count."""
+    return node_data['io_traffic_details'].get('total_packet_count', 0)
+
+
 class BTZRewardLogic:
     """
     Manages the Proof-of-Traffic-Volume (PoTV) consensus for the BTZCY-SYSTEM token.
@@ -33,32 +42,27 @@ class BTZRewardLogic:
             return None
 
         # 1. Select the raw winner based on the highest total packet count
-        sorted_nodes = sorted(
-            verified_traffic_data, 
-            key=lambda x: x['io_traffic_details'].get('total_packet_count', 0), 
-            reverse=True
-        )
+        winner = max(verified_traffic_data, key=_total_packet_count)
         
         # 2. Logistical check: Ensure the winner is verified
-        winner = sorted_nodes[0]
         if not winner['is_verified']:
              # Theoretically, this shouldn't happen if input is pre-verified, 
              # but acts as a safety check.
-            print(f"WARNING: Highest traffic node {winner['address']} failed final verification.")
+            logger.warning("Highest traffic node %s failed final verification.", winner['address'])
             return None 
 
         return winner
 
-    def _create_ethical_choice_challenge(self, winner_address: str, packet_count: int) -> Dict[str, Any]:
+    def _create_ethical_choice_challenge(self, winner_address: str, packet_count: int, now: float) -> Dict[str, Any]:
         """
         Generates the payload for the 'Human Ethical Choice' challenge.
         The node owner must explicitly accept the reward within the 5-minute window.
         """
         
-        challenge_id = hashlib.sha256(f"{winner_address}-{packet_count}-{time.time()}".encode()).hexdigest()
+        challenge_id = hashlib.blake2b(f"{winner_address}-{packet_count}-{now}".encode(), digest_size=32).hexdigest()
         
         # The node must accept the reward before this timestamp (5 minutes from generation)
-        expiry_timestamp = int(time.time()) + self.BTZ_CYCLE_TIME_SECONDS
+        expiry_timestamp = int(now) + self.BTZ_CYCLE_TIME_SECONDS
         
         return {
             "challenge_id": challenge_id,
@@ -78,54 +82,55 @@ class BTZRewardLogic:
         """
         
         # 1. Time Gate: Ensure the 5-minute cycle has elapsed
-        if time.time() - self.last_reward_time < self.BTZ_CYCLE_TIME_SECONDS:
+        # (one clock read serves the whole cycle)
+        now = time.time()
+        if now - self.last_reward_time < self.BTZ_CYCLE_TIME_SECONDS:
              return None
         
         if not all_active_nodes:
             return None
 
-        print(f"--- BTZ PoTV Consensus Active. Time Check Passed. ---")
+        logger.info("--- BTZ PoTV Consensus Active. Time Check Passed. ---")
 
         # 2. Aggregate and Verify Data
-        # Get raw traffic data structure from the analyzer (File 6)
-        raw_traffic_data = self.analyzer.aggregate_all_node_traffic(all_active_nodes)
-        
-        # Merge traffic data with verification reports (File 8)
+        # Verification reports (File 8) come back in node order, so each one 
+        # pairs positionally with the traffic record generated for the same 
+        # node (File 6) in a single fused pass. strict=True turns a length 
+        # mismatch into an error instead of pairing a proof with the wrong node.
         verified_reports = self.verifier.bulk_verify_nodes(all_active_nodes)
         
         # Combine the two datasets for a final list of eligible nodes
         eligible_nodes = []
-        for traffic in raw_traffic_data:
-            report = next((r for r in verified_reports if r['address'] == traffic['node_address']), None)
-            if report and report['is_verified']:
-                # Stamp the verification results onto the traffic data
-                traffic_stamp = traffic.copy()
-                traffic_stamp['is_verified'] = report['is_verified']
-                traffic_stamp['verification_hash_proof'] = report['verification_hash_proof']
-                traffic_stamp['io_traffic_details'] = traffic['io_traffic_details']
-                traffic_stamp['address'] = traffic['node_address']
-                eligible_nodes.append(traffic_stamp)
+        add_eligible = eligible_nodes.append
+        for traffic, report in zip(self.analyzer.iter_node_traffic(all_active_nodes, now), verified_reports, strict=True):
+            if report['is_verified']:
+                # Stamp the verification results onto the traffic data. Each 
+                # record is freshly generated for this cycle, so no copy is needed.
+                traffic['is_verified'] = True
+                traffic['verification_hash_proof'] = report['verification_hash_proof']
+                traffic['address'] = traffic['node_address']
+                add_eligible(traffic)
 
 
         # 3. Determine the PoTV Winner
-        winner_data = self._determine_highest_traffic_node(eligible_nodes)
+        winner_data = self._determine_highest_traffic_winner(eligible_nodes)
         
         if not winner_data:
-            print("BTZ Consensus: No verified, high-traffic winner found this cycle.")
+            logger.info("BTZ Consensus: No verified, high-traffic winner found this cycle.")
             return None
 
         # 4. Initiate the Human Ethical Choice Challenge
         winner_address = winner_data["address"]
         packet_count = winner_data["io_traffic_details"]["total_packet_count"]
         
-        challenge_payload = self._create_ethical_choice_challenge(winner_address, packet_count)
+        challenge_payload = self._create_ethical_choice_challenge(winner_address, packet_count, now)
         
         # 5. Assume acceptance (since the acceptance function is outside this core logic)
         # In a real system, the main_node_runner would wait for a 'YES' transaction.
         # For seamless block stamping, we stamp the *challenge* block here:
         
         # Update timer
-        self.last_reward_time = time.time()
+        self.last_reward_time = now
         
         return {
             "winner_address": winner_address,
@@ -4,11 +4,14 @@ from typing import List, Dict, Any, Optional
 
 # Dependency on the structural data provider (File 6)
 from TOKEN_1_SNIFFEE.wifi_analyzer import ConceptualWifiAnalyzer 
+# The PoTV winner key, shared with the BTZ reward logic
+from TOKEN_2_BTZCY.btz_reward_logic import _total_packet_count
 
 # Define the constants for the BTZ system
 BTZ_REWARD_AMOUNT = 150
 BTZ_CYCLE_TIME_SECONDS = 300 # 5 minutes
 
+
 class PacketIOMonitor:
     """
     Manages the Proof-of-Traffic-Volume (PoTV) consensus for the BTZCY-SYSTEM token.
@@ -30,17 +33,11 @@ class PacketIOMonitor:
         if not node_traffic_data:
             return None
 
-        # Sort all verified nodes by their total packet count (highest first)
-        sorted_nodes = sorted(
-            node_traffic_data, 
-            key=lambda x: x.get('total_packet_count', 0), 
-            reverse=True
-        )
-        
-        # The top node is the PoTV winner
-        return sorted_nodes[0]
+        # The node with the highest total packet count is the PoTV winner
+        # (a single pass; ties keep the first node, as the stable sort did)
+        return max(node_traffic_data, key=_total_packet_count)
 
-    def _create_ethical_choice_challenge(self, winner_address: str) -> Dict[str, Any]:
+    def _create_ethical_choice_challenge(self, winner_address: str, now: float) -> Dict[str, Any]:
         """
         Generates the payload for the 'Human Ethical Choice' challenge, requiring 
         the node owner to explicitly accept the reward within 5 minutes.
@@ -49,10 +46,10 @@ class PacketIOMonitor:
         indexing ethical data (simulated "cookies/consent") from the winning node.
         """
         
-        challenge_id = f"ETHICAL_CHOICE_{hash(f'{winner_address}-{time.time()}')}_{random.getrandbits(32)}"
+        challenge_id = f"ETHICAL_CHOICE_{hash(f'{winner_address}-{now}')}_{random.getrandbits(32)}"
         
         # The node must accept the reward before this timestamp
-        expiry_timestamp = int(time.time()) + BTZ_CYCLE_TIME_SECONDS
+        expiry_timestamp = int(now) + BTZ_CYCLE_TIME_SECONDS
         
         return {
             "challenge_id": challenge_id,
@@ -73,14 +70,16 @@ class PacketIOMonitor:
             or None if the cycle time has not elapsed.
         """
         # Time check: Ensure the 5-minute cycle has elapsed (300 seconds)
-        if time.time() - self.last_reward_time < BTZ_CYCLE_TIME_SECONDS:
+        # (one clock read serves the whole cycle)
+        now = time.time()
+        if now - self.last_reward_time < BTZ_CYCLE_TIME_SECONDS:
              return None
         
         if not all_active_nodes:
             return None
 
         # 1. Aggregate and verify traffic data (simulated PING/NMAP verification)
-        verified_traffic_data = self.analyzer.aggregate_all_node_traffic(all_active_nodes)
+        verified_traffic_data = self.analyzer.aggregate_all_node_traffic(all_active_nodes, now)
 
         # 2. Determine the PoTV winner
         winner_data = self._select_highest_traffic_node(verified_traffic_data)
@@ -89,10 +88,10 @@ class PacketIOMonitor:
             return None
 
         # 3. Initiate the Human Ethical Choice Challenge
-        challenge_payload = self._create_ethical_choice_challenge(winner_data["node_address"])
+        challenge_payload = self._create_ethical_choice_challenge(winner_data["node_address"], now)
 
         # 4. Update timer and return the Stamped Challenge Data
-        self.last_reward_time = time.time()
+        self.last_reward_time = now
         
         return {
             "winner_address": winner_data["node_address"],
@@ -1,7 +1,7 @@
 import random
 import time
 import hashlib
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Union, Tuple
 
 class PingNmapVerifier:
     """
@@ -19,31 +19,51 @@ class PingNmapVerifier:
     MAX_LATENCY_MS = 150 
     DEFAULT_PING_PACKETS = 4 
     CONNECTIVITY_SUCCESS_RATE = 0.9 
+    MAX_VERIFICATION_NONCE = 10000 # Safety break for simulation
 
     def __init__(self):
         """Initializes the verifier with a conceptual difficulty target."""
         self.difficulty_target = self.MINIMUM_VERIFICATION_HASH_DIFFICULTY
 
+    @staticmethod
+    def _difficulty_mask(difficulty_target: str) -> Tuple[int, int, int]:
+        """
+        Translates a hex-prefix target into a check on the raw digest: the number 
+        of leading digest bytes to read, the shift that drops any trailing half 
+        byte, and the value those leading bits must equal.
+        """
+        nibbles = len(difficulty_target)
+        prefix_bytes = (nibbles + 1) // 2
+        shift = 4 * (2 * prefix_bytes - nibbles)
+        return prefix_bytes, shift, int(difficulty_target or "0", 16)
+
     def _generate_proof_of_verification_work(self, raw_data: str) -> str:
         """
         A micro-PoW mechanism: hashes the network data until the difficulty 
         target is met, simulating the computational cost of real-time analysis.
         This provides a 'non-simulated' computational expense to the verification process.
         """
-        nonce = 0
-        while True:
+        # Compare the leading digest bits directly instead of hex-encoding every attempt
+        prefix_bytes, shift, expected = self._difficulty_mask(self.difficulty_target)
+        
+        # The raw data prefix never changes between attempts: absorb it once and 
+        # resume from a copy of that state, feeding only a fixed-width nonce
+        base_state = hashlib.sha256(raw_data.encode('utf-8'))
+        copy_state = base_state.copy
+        from_bytes = int.from_bytes
+        
+        for nonce in range(self.MAX_VERIFICATION_NONCE + 1):
             # Combine raw data and nonce
-            attempt = f"{raw_data}{nonce}"
+            attempt = copy_state()
+            attempt.update(nonce.to_bytes(4, 'big'))
             # Use SHA256 for integrity check
-            hash_result = hashlib.sha256(attempt.encode('utf-8')).hexdigest()
+            digest = attempt.digest()
             
             # Check if the hash meets the difficulty target
-            if hash_result.startswith(self.difficulty_target):
-                return hash_result
-            
-            nonce += 1
-            if nonce > 10000: # Safety break for simulation
-                return f"NonceExceeded-{hash_result[:10]}"
+            if from_bytes(digest[:prefix_bytes], 'big') >> shift == expected:
+                return digest.hex()
+        
+        return f"NonceExceeded-{digest[:5].hex()}"
 
     def _simulated_ping(self, address: str) -> Dict[str, Union[str, float, int]]:
         """
@@ -58,7 +78,10 @@ class PingNmapVerifier:
                 "raw_latency_data": ""
             }
         
-        latency_values = [random.uniform(20.0, self.MAX_LATENCY_MS) 
+        # Same distribution as random.uniform(20.0, MAX_LATENCY_MS), inlined
+        rand = random.random
+        latency_span = self.MAX_LATENCY_MS - 20.0
+        latency_values = [20.0 + latency_span * rand() 
                           for _ in range(self.DEFAULT_PING_PACKETS)]
         
         # Create traceable raw data string from the simulation result
@@ -79,7 +102,8 @@ class PingNmapVerifier:
         
         return {
             "service_status": "RUNNING" if is_service_running else "BLOCKED",
-            "verified_ports_hash": hashlib.sha256(f"{address}-{int(is_service_running)}".encode()).hexdigest()[:10],
+            # A 5-byte BLAKE2b digest is exactly the 10 hex characters kept
+            "verified_ports_hash": hashlib.blake2b(f"{address}-{int(is_service_running)}".encode(), digest_size=5).hexdigest(),
             "scan_timestamp": int(time.time())
         }
 
@@ -1,22 +1,30 @@
-import sys
 import os
+import json
 import time
+import importlib
+import heapq
 import random
-from typing import List, Dict, Any
-from logging import Logger
-
-# --- HIGH-LEVEL COMPUTATIONAL FIX FOR MODULE RESOLUTION ---
-# This ensures that packages like CORE_SYSTEMS and TOKEN_1_SNIFFEE are found.
-# It adds the project's root directory to the Python search path.
-# This is necessary when running a file deep within a package structure directly.
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
-sys.path.append(project_root)
-# ----------------------------------------------------------
-
-# Dependencies from the 12-File Architecture
-from CORE_SYSTEMS.block_stamping_engine import BlockStampingEngine
+import logging
+import logging.handlers
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Sequence, Deque, Tuple, Callable
+
+# Dependencies from the 12-File Architecture. The runner lives in the project 
+# root, next to CORE_SYSTEMS and the token packages, so running it as a script 
+# puts them on the import path; no sys.path manipulation is needed.
+from CORE_SYSTEMS.block_stamping_engine import BlockStampingEngine, BlockHeader
 from CORE_SYSTEMS.consensus_manager import ConsensusManager
 
+# The utilities package directory name starts with a space, which no import 
+# statement can spell; importlib resolves it by its exact name.
+WalletAddressHandler = importlib.import_module(" UTILITIES_AND_SECURITY.wallet_address_handler").WalletAddressHandler
+DataLoggerOutput = importlib.import_module(" UTILITIES_AND_SECURITY.data_logger_output").DataLoggerOutput
+
+logger = logging.getLogger(__name__)
+
 
 
 # --- BLOCKCHAIN CONSTANTS (Knowing the Known) ---
@@ -28,93 +36,402 @@ COMPLEXITY_GROWTH_INCREMENT: float = 0.0000001
 SDB_REWARD_CYCLE: int = 30 * 60  # 30 minutes
 BTZ_REWARD_CYCLE: int = 5 * 60   # 5 minutes
 
+# The Genesis Block carries no reward; it only anchors the chain
+GENESIS_MINER_ADDRESS: str = "0x0"
+GENESIS_REWARD_CHAIN: str = "GENESIS"
+
+# A scheduled reward cycle: (due time, cycle name, consensus function, period). 
+# Due times are on the time.monotonic() clock, immune to wall-clock steps (NTP).
+ScheduledCycle = Tuple[float, str, Callable[..., Optional[Dict[str, Any]]], float]
+
+# Number of most recent block headers kept in memory; the full chain lives in 
+# the DataLoggerOutput's append-only JSONL audit log.
+RECENT_BLOCKS_CACHE_SIZE: int = 128
+
+# Scheduler state saved when the node stops, so a restart resumes in the same phase
+STATE_FILEPATH: str = "node_state.json"
+
+# How long to wait before re-running a cycle that is due but produced no winner
+CYCLE_RETRY_SECONDS: float = 1.0
+
+# Error backoff: doubles per consecutive failure (the first retry waits about 
+# 10 seconds), capped, with +/-50% jitter
+ERROR_BACKOFF_BASE_SECONDS: float = 5.0
+ERROR_BACKOFF_MAX_SECONDS: float = 300.0
+
 class BlockchainNodeRunner:
     """
     The main looping function (the heart) of the Blockchain Node. 
     It orchestrates the dual-token reward cycles and block stamping.
     """
+    # Fixed attribute layout: no per-instance __dict__, indexed attribute access
+    __slots__ = (
+        "recent_blocks", "chain_height", "_complexity_ticks",
+        "wallet_handler", "data_logger", "stamping_engine", "consensus_manager",
+        "_schedule", "_stamp_executor", "_pending_stamps", "_chain_lock", "_fail_backoff", "_stop",
+    )
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initializes all 12 file components and the blockchain state."""
-        print("Initializing Blockchain Node Components...")
+        logger.info("Initializing Blockchain Node Components...")
         
-        # Core State
-        self.blockchain: List[Dict[str, Any]] = []
-        self.current_complexity: float = INITIAL_COMPLEXITY
+        # Core State: a bounded window of headers at the chain tip, plus the chain height
+        self.recent_blocks: Deque[BlockHeader] = deque(maxlen=RECENT_BLOCKS_CACHE_SIZE)
+        self.chain_height: int = 0
+        # Progressive Eternity growth steps applied so far (exact, unlike a float sum)
+        self._complexity_ticks: int = 0
         
-        # Utilities & Security
-        self.wallet_handler = WalletAddressHandler()
-        self.data_logger = DataLoggerOutput()
+        # Utilities & Security (loaded through importlib, so typed as Any)
+        self.wallet_handler: Any = WalletAddressHandler()
+        self.data_logger: Any = DataLoggerOutput()
         
         # Core Systems
-        # FIX APPLIED HERE: Changed 'Logger' to 'logger'
-        self.stamping_engine = BlockStampingEngine(
-            chain=List,
-            complexity=0.1
+        # The engine shares the runner's recent-block window (no second copy of 
+        # the chain) and starts at the runner's complexity.
+        self.stamping_engine: BlockStampingEngine = BlockStampingEngine(
+            chain=self.recent_blocks,
+            complexity=self.current_complexity,
+            data_logger=self.data_logger
         )
-        self.consensus_manager = ConsensusManager(sdb_reward=1500, btz_reward=150)
+        self.consensus_manager: ConsensusManager = ConsensusManager(sdb_reward=1500, btz_reward=150)
+        
+        # Min-heap of reward cycles keyed on their absolute deadline 
+        # (due immediately until genesis)
+        self._schedule: List[ScheduledCycle] = self._build_schedule(0.0)
+        
+        # Block stamping runs on one worker thread, off the scheduling loop. A 
+        # single worker keeps stamps in submission order, so each one builds on 
+        # the tip committed by the previous one.
+        self._stamp_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="block-stamper")
+        self._pending_stamps: Deque["Future[List[Tuple[Dict[str, Any], Exception]]]"] = deque()
+        # Guards the chain state the worker commits (recent_blocks, chain_height, 
+        # _complexity_ticks) against reads from the scheduling thread
+        self._chain_lock: threading.Lock = threading.Lock()
+        
+        # Current error backoff; reset after every clean pass of the main loop
+        self._fail_backoff: float = ERROR_BACKOFF_BASE_SECONDS
         
-        # Time Trackers for reward cycles
-        self.last_sdb_reward_time: float = 0.0
-        self.last_btz_reward_time: float = 0.0
-
-    def _create_genesis_block(self):
-        """Creates the very first block to initialize the chain."""
-        print("Creating Genesis Block...")
-        genesis_block = self.stamping_engine.stamp_new_block(miner_address=any)
-        self.blockchain.append(genesis_block)
-        self.data_logger.log_block(genesis_block, self.blockchain)
-        self.last_sdb_reward_time = time.time()
-        self.last_btz_reward_time = time.time()
-        print("Genesis Block Stamped. Node is now operational.")
+        # Set by stop(); the main loop waits on it, so shutdown is immediate
+        self._stop: threading.Event = threading.Event()
+
+    def _create_genesis_block(self, now: float) -> None:
+        """
+        Creates the very first block to initialize the chain. Both reward cycles 
+        are scheduled from `now`, the single clock reading taken at boot.
+        """
+        logger.info("Creating Genesis Block...")
+        genesis_block = self.stamping_engine.stamp_new_block(
+            miner_address=GENESIS_MINER_ADDRESS,
+            reward_type=GENESIS_REWARD_CHAIN,
+            reward_amount=0,
+            binary_transit_no=0,
+            is_genesis=True
+        )
+        self._commit_block(genesis_block)
+        self._schedule = self._build_schedule(now)
+        logger.info("Genesis Block Stamped. Node is now operational.")
+
+    def head(self) -> BlockHeader:
+        """Returns the header of the newest block of the chain (the tip)."""
+        return self.recent_blocks[-1]
+
+    def _commit_block(self, block: Dict[str, Any]) -> None:
+        """
+        Appends a stamped block to the chain: persisted in full through the data 
+        logger, while only its header is kept in the in-memory window.
+        """
+        self.recent_blocks.append(BlockHeader.from_block(block))
+        self.chain_height += 1
+        self.data_logger.log_block(block)
+
+    @property
+    def current_complexity(self) -> float:
+        """The Progressive Eternity factor, derived from the integer growth ticks."""
+        return INITIAL_COMPLEXITY + self._complexity_ticks * COMPLEXITY_GROWTH_INCREMENT
 
     def _update_complexity(self) -> None:
         """Applies the 'Progressive Eternity' rule: complexity always grows."""
-        self.current_complexity += COMPLEXITY_GROWTH_INCREMENT
+        self._complexity_ticks += 1
+
+    def stop(self) -> None:
+        """Requests a clean shutdown; wakes the main loop if it is waiting."""
+        self._stop.set()
+
+    @staticmethod
+    def _advance_deadline(deadline: float, period: float, now: float) -> float:
+        """
+        Moves a cycle deadline forward by one period, keeping the cadence free of 
+        drift. A deadline that has fallen a whole period behind restarts from now 
+        rather than firing back-to-back to catch up.
+        """
+        deadline += period
+        return deadline if deadline > now else now + period
+
+    def _build_schedule(self, start: float, deadlines: Optional[Dict[str, float]] = None) -> List[ScheduledCycle]:
+        """
+        Builds the reward-cycle heap, each cycle first due one period after 
+        `start` unless `deadlines` (by cycle name) says otherwise. Adding a 
+        reward token only takes one more entry here.
+        """
+        cycles = [
+            ("SDB", self.consensus_manager.run_sdb_consensus, SDB_REWARD_CYCLE),
+            ("BTZ", self.consensus_manager.run_btz_consensus, BTZ_REWARD_CYCLE),
+        ]
+        deadlines = deadlines or {}
+        schedule = [
+            (deadlines.get(name, start + period), name, run_consensus, period)
+            for name, run_consensus, period in cycles
+        ]
+        heapq.heapify(schedule)
+        return schedule
+
+    # --- Restart State ---
+
+    def _reward_logics(self) -> Dict[str, Any]:
+        """The per-token reward logic behind each scheduled cycle, by cycle name."""
+        return {"SDB": self.consensus_manager.sdb_logic, "BTZ": self.consensus_manager.btz_logic}
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Reads the scheduler state saved by the previous run (empty if there is none)."""
+        try:
+            with open(STATE_FILEPATH, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (IOError, ValueError) as e:
+            logger.warning("Ignoring unreadable node state %s: %s", STATE_FILEPATH, e)
+            return {}
 
-    def run_node(self):
-        """The main infinite loop for node operation."""
-        if not self.blockchain:
-            self._create_genesis_block()
+    def _save_state(self) -> None:
+        """
+        Writes the cycle deadlines, complexity ticks and each reward logic's 
+        last-win time for the next run. The file is replaced atomically, so a 
+        crash mid-write keeps the old state. Deadlines are saved as wall-clock 
+        times, since the monotonic clock restarts with the machine.
+        """
+        to_wall_clock = time.time() - time.monotonic()
+        with self._chain_lock:
+            complexity_ticks = self._complexity_ticks
+        state = {
+            "deadlines": {name: due + to_wall_clock for due, name, _, _ in self._schedule},
+            "complexity_ticks": complexity_ticks,
+            # The reward logic gates each cycle on its own wall-clock timer too
+            "last_reward_times": {
+                name: logic.last_reward_time for name, logic in self._reward_logics().items()
+            },
+        }
+        tmp_path = STATE_FILEPATH + ".tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, STATE_FILEPATH)
+        except IOError as e:
+            logger.error("Could not save node state: %s", e)
 
-        while True:
+    def _resume_chain(self, now: float) -> bool:
+        """
+        Resumes a chain already on disk: reloads the newest blocks from the 
+        audit log and the saved cycle phase. Returns False if there is no chain.
+        """
+        blocks = self.data_logger.read_recent_blocks(RECENT_BLOCKS_CACHE_SIZE)
+        if not blocks:
+            return False
+        self.recent_blocks.extend(map(BlockHeader.from_block, blocks))
+        self.chain_height = int(blocks[-1]["BLOCK_INDEX"])
+        
+        state = self._load_state()
+        # Every block after genesis grew the complexity by one tick
+        self._complexity_ticks = int(state.get("complexity_ticks", self.chain_height - 1))
+        to_monotonic = now - time.time()
+        deadlines = {name: due + to_monotonic for name, due in state.get("deadlines", {}).items()}
+        self._schedule = self._build_schedule(now, deadlines)
+        # Without its last-win time, a logic would refuse to run for a full 
+        # period from boot, however overdue its restored deadline is
+        logics = self._reward_logics()
+        for name, last_reward_time in state.get("last_reward_times", {}).items():
+            if name in logics:
+                logics[name].last_reward_time = float(last_reward_time)
+        logger.info("Resumed chain at block %d.", self.chain_height)
+        return True
+
+    def _stamp_reward(self, reward_data: Dict[str, Any]) -> None:
+        """
+        Stamps a reward block for a consensus winner and commits it to the chain. 
+        Runs on the stamping worker thread, the only writer of the chain state.
+        """
+        self.stamping_engine.update_complexity(self.current_complexity)
+        block = self.stamping_engine.stamp_new_block(
+            miner_address=reward_data["winner_address"],
+            reward_type=reward_data["reward_type"],
+            reward_amount=reward_data["reward_amount"],
+            binary_transit_no=reward_data.get("binary_transit_no", 0),
+            seedframe=reward_data.get("seedframe", "0"),
+            parent_header=self.head()
+        )
+        with self._chain_lock:
+            self._commit_block(block)
+            self._update_complexity()
+
+    def _stamp_rewards(self, batch: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Exception]]:
+        """
+        Stamps the rewards won on one pass of the loop, back-to-back in a single 
+        worker task. A failed stamp does not stop the rest of the batch; each 
+        failure is returned with its reward, so the reward can be retried.
+        """
+        failed: List[Tuple[Dict[str, Any], Exception]] = []
+        for reward_data in batch:
+            try:
+                self._stamp_reward(reward_data)
+            except Exception as e:
+                logger.exception("Stamping the %s reward for %s failed; it will be retried.", 
+                                 reward_data.get("reward_type"), reward_data.get("winner_address"))
+                failed.append((reward_data, e))
+        return failed
+
+    def _submit_stamps(self, batch: List[Dict[str, Any]]) -> None:
+        """Queues reward blocks for stamping without blocking the scheduling loop."""
+        self._pending_stamps.append(self._stamp_executor.submit(self._stamp_rewards, batch))
+
+    def _collect_finished_stamps(self) -> None:
+        """
+        Retires completed stamps in submission order. Rewards whose stamp failed 
+        are queued for stamping again (the cycle that won them has already moved 
+        on, and re-running its consensus would not win them back), then the 
+        first error re-raises here, on the main loop, so retries are paced by 
+        the error backoff.
+        """
+        pending = self._pending_stamps
+        retry: List[Dict[str, Any]] = []
+        first_error: Optional[Exception] = None
+        while pending and pending[0].done():
+            for reward_data, error in pending.popleft().result():
+                retry.append(reward_data)
+                if first_error is None:
+                    first_error = error
+        if first_error is not None:
+            self._submit_stamps(retry)
+            raise first_error
+
+    def _run_due_cycles(self, current_time: float) -> None:
+        """
+        Pops every cycle whose deadline has passed and runs its consensus. A 
+        cycle that stamps a block is pushed back one period later; one without 
+        a winner (or interrupted by an error) goes back unchanged, to be retried. 
+        Cycles due together (every sixth BTZ cycle lands on an SDB one) hand 
+        their winners to the stamper as one batch. The active node list is 
+        fetched once per pass, and only once a cycle is actually due.
+        """
+        schedule = self._schedule
+        pending: List[ScheduledCycle] = []
+        winners: List[Dict[str, Any]] = []
+        active_nodes: Optional[Sequence[str]] = None
+        # Hoisted lookups: each is used once per due cycle
+        heappop, heappush = heapq.heappop, heapq.heappush
+        advance_deadline = self._advance_deadline
+        try:
+            # Every due cycle may be popped (none of them winning), emptying the heap
+            while schedule and schedule[0][0] <= current_time:
+                cycle = heappop(schedule)
+                pending.append(cycle)
+                due, name, run_consensus, period = cycle
+                
+                if active_nodes is None:
+                    # The wallet handler keeps an immutable snapshot, rebuilt on registration
+                    active_nodes = self.wallet_handler.get_all_active_addresses()
+                reward_data = run_consensus(active_nodes)
+                if reward_data:
+                    winners.append(reward_data)
+                    pending.pop()
+                    heappush(schedule, (advance_deadline(due, period, current_time), name, run_consensus, period))
+        finally:
+            # Winners already rescheduled are stamped even if a later cycle failed
+            if winners:
+                self._submit_stamps(winners)
+            for cycle in pending:
+                heapq.heappush(schedule, cycle)
+
+    def _seconds_until_next_cycle(self) -> float:
+        """
+        Returns how long the loop can sleep before the earliest reward cycle is 
+        due. A cycle that is already due (it ran without producing a winner) is 
+        retried after CYCLE_RETRY_SECONDS.
+        """
+        sleep_for = self._schedule[0][0] - time.monotonic()
+        return sleep_for if sleep_for > 0 else CYCLE_RETRY_SECONDS
+
+    def run_node(self) -> None:
+        """The main loop for node operation; runs until stop() is called."""
+        current_time = time.monotonic()
+        if not self._resume_chain(current_time):
+            self._create_genesis_block(current_time)
+
+        try:
+            self._run_main_loop(current_time)
+        finally:
+            # Let any queued stamps finish so no won reward is left unstamped, 
+            # then record the phase (and complexity) they leave behind
+            self._stamp_executor.shutdown(wait=True)
+            self._save_state()
+
+    def _run_main_loop(self, current_time: float) -> None:
+        """Schedules the reward cycles until stop() is called."""
+        # Bound once, so each wake-up runs on local names rather than attribute lookups
+        is_stopped = self._stop.is_set
+        wait = self._stop.wait
+        collect_finished_stamps = self._collect_finished_stamps
+        run_due_cycles = self._run_due_cycles
+        seconds_until_next_cycle = self._seconds_until_next_cycle
+        monotonic = time.monotonic
+        
+        while not is_stopped():
             try:
-                current_time = time.time()
-                active_nodes = self.wallet_handler.get_all_active_addresses()
-
-                # --- SDB Reward Cycle (30 minutes) ---
-                if current_time - self.last_sdb_reward_time >= SDB_REWARD_CYCLE:
-                    reward_data = self.consensus_manager.run_sdb_consensus(active_nodes)
-                    if reward_data:
-                        self.stamping_engine.stamp_new_block(
-                            chain=self.blockchain,
-                            reward_data=reward_data,
-                            complexity=self.current_complexity,
-                            wallet_handler=self.wallet_handler
-                        )
-                        self._update_complexity()
-                        self.last_sdb_reward_time = current_time
-
-                # --- BTZ Reward Cycle (5 minutes) ---
-                if current_time - self.last_btz_reward_time >= BTZ_REWARD_CYCLE:
-                    reward_data = self.consensus_manager.run_btz_consensus(active_nodes)
-                    if reward_data:
-                        self.stamping_engine.stamp_new_block(
-                            chain=self.blockchain,
-                            reward_data=reward_data,
-                            complexity=self.current_complexity,
-                            wallet_handler=self.wallet_handler
-                        )
-                        self._update_complexity()
-                        self.last_btz_reward_time = current_time
-
-                # Sleep time: Use a low value to check both timers frequently
-                time.sleep(1) 
+                collect_finished_stamps()
+                
+                # --- SDB (30 minutes) and BTZ (5 minutes) Reward Cycles ---
+                run_due_cycles(current_time)
+                self._fail_backoff = ERROR_BACKOFF_BASE_SECONDS
+
+                # Sleep until the next cycle is due instead of polling the timers
+                wait(seconds_until_next_cycle())
 
             except Exception as e:
-                print(f"\nFATAL ERROR IN MAIN LOOP: {e}")
-                time.sleep(10) # Wait before attempting to resume
+                logger.exception("FATAL ERROR IN MAIN LOOP: %s", e)
+                # Back off before attempting to resume, longer for each consecutive failure
+                self._fail_backoff = min(self._fail_backoff * 2, ERROR_BACKOFF_MAX_SECONDS)
+                wait(self._fail_backoff * (0.5 + random.random()))
+            
+            # One clock reading per wake-up, shared by every cycle it runs
+            current_time = monotonic()
+
+
+def _start_console_logging() -> logging.handlers.QueueListener:
+    """
+    Routes every log record through an in-memory queue: callers only enqueue, 
+    and a background listener thread does the console writes.
+    """
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    return listener
+
+
+def main() -> None:
+    """Entry point: starts console logging and runs the node until it is stopped."""
+    # Component modules log through 'logging'; show their INFO records on the console
+    log_listener = _start_console_logging()
+    try:
+        runner = BlockchainNodeRunner()
+        runner.run_node()
+    finally:
+        log_listener.stop() # Drains any queued records before exit
+
 
 if __name__ == '__main__':
-    runner = BlockchainNodeRunner()
-    runner.run_node()
+    main()
@@ -0,0 +1,114 @@
+"""
+Tests for the ledger and audit snapshot output of UTILITIES_AND_SECURITY/data_logger_output.py.
+
+Run from the project root (the directory holding main_node_runner.py):
+    python -m unittest discover -s tests
+"""
+import csv
+import importlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# The package directory name starts with a space; importlib resolves it by its exact name
+data_logger_output = importlib.import_module(" UTILITIES_AND_SECURITY.data_logger_output")
+DataLoggerOutput = data_logger_output.DataLoggerOutput
+
+
+class TestFormatCsvRow(unittest.TestCase):
+    """The hand-rolled formatter must stay byte-identical to csv.writer (QUOTE_MINIMAL)."""
+
+    TEXT_CELLS = [
+        "plain", "", None, 'say "hi"', '"', "a,b", ",", "line\nbreak", "carriage\rreturn",
+        "\r\n", ' leading space', "trailing space ", "tab\tcell", "é€ unicode", "0xADDR,@SNIFFEE",
+    ]
+    NUMBER_CELLS = [0, -1, 1 << 70, 1.5, 1e-12, 1.0000001, float("inf"), True, "", None]
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.logger = DataLoggerOutput()
+
+    def tearDown(self):
+        self.logger.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def csv_writer_line(self, row) -> str:
+        out = io.StringIO()
+        csv.writer(out, quoting=csv.QUOTE_MINIMAL, lineterminator="\r\n").writerow(row)
+        return out.getvalue()
+
+    def rows(self):
+        """Full-width rows that put every sample cell in every ledger column."""
+        width = len(self.logger.csv_fieldnames)
+        samples = self.TEXT_CELLS + self.NUMBER_CELLS
+        for offset in range(len(samples)):
+            yield tuple(samples[(offset + column) % len(samples)] for column in range(width))
+
+    def test_rows_match_csv_writer(self):
+        for row in self.rows():
+            with self.subTest(row=row):
+                self.assertEqual(self.logger._format_csv_row(row), self.csv_writer_line(row))
+
+    def test_flushed_ledger_round_trips_through_csv_reader(self):
+        rows = list(self.rows())
+        self.logger._csv_buffer.extend(rows)
+        self.logger.flush()
+
+        with open(self.logger.CSV_FILEPATH, newline='') as f:
+            header, *parsed = list(csv.reader(f))
+        self.assertEqual(header, self.logger.csv_fieldnames)
+        expected = [["" if cell is None else str(cell) for cell in row] for row in rows]
+        self.assertEqual(parsed, expected)
+
+
+class TestExportAuditSnapshot(unittest.TestCase):
+
+    BLOCKS = [
+        {"BLOCK_INDEX": 1, "REWARD_CHAIN": "GENESIS", "COMPLEXITY_LEVEL": 1e-07, "SEEDFRAME": "0"},
+        {"BLOCK_INDEX": 2, "REWARD_CHAIN": "BTZCY-SYSTEM", "REWARD_AMOUNT": 150,
+         "SOFT-ENCRYPTER": "é€ soft", "PROOF_DATA": {"ok": True, "none": None, "latencies": [1.5, 12], "empty": {}}},
+    ]
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.logger = DataLoggerOutput()
+        for block in self.BLOCKS:
+            self.logger._log_to_json(dict(block))
+
+    def tearDown(self):
+        self.logger.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def snapshot(self) -> bytes:
+        self.logger.export_audit_snapshot()
+        with open(self.logger.JSON_FILEPATH, 'rb') as f:
+            return f.read()
+
+    @staticmethod
+    def indentation(snapshot: bytes):
+        return [len(line) - len(line.lstrip(b" ")) for line in snapshot.splitlines()]
+
+    def test_fallback_snapshot_matches_orjson(self):
+        with mock.patch.object(data_logger_output, "orjson", None):
+            fallback = self.snapshot()
+        self.assertEqual(json.loads(fallback), self.BLOCKS)
+        self.assertIn("é€ soft".encode('utf-8'), fallback)
+        if data_logger_output.orjson is None:
+            self.skipTest("orjson is not installed")
+        # Same document and layout; only float spelling may differ (1e-07 vs 1e-7)
+        accelerated = self.snapshot()
+        self.assertEqual(json.loads(accelerated), json.loads(fallback))
+        self.assertEqual(self.indentation(accelerated), self.indentation(fallback))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,324 @@
+"""
+Tests for the reward-cycle scheduler of main_node_runner.py.
+
+Run from the project root (the directory holding main_node_runner.py):
+    python -m unittest discover -s tests
+"""
+import heapq
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from typing import Any, Callable, Dict, List, Optional
+
+import main_node_runner
+from main_node_runner import BlockchainNodeRunner, CYCLE_RETRY_SECONDS
+
+
+def _no_winner(active_nodes) -> Optional[Dict[str, Any]]:
+    """Consensus stub: the cycle ran but nobody won."""
+    return None
+
+
+def _winner(reward_type: str) -> Callable[..., Dict[str, Any]]:
+    """Consensus stub: the cycle always produces a winner of the given reward type."""
+    def run_consensus(active_nodes) -> Dict[str, Any]:
+        return {
+            "winner_address": active_nodes[0],
+            "reward_type": reward_type,
+            "reward_amount": 150,
+            "binary_transit_no": 4200,
+        }
+    return run_consensus
+
+
+def _broken(active_nodes) -> Optional[Dict[str, Any]]:
+    """Consensus stub: the cycle fails outright."""
+    raise RuntimeError("consensus unavailable")
+
+
+class RunnerTestCase(unittest.TestCase):
+    """Builds a real runner inside a scratch directory, so its ledger files never touch the tree."""
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        self.runner = BlockchainNodeRunner()
+
+    def tearDown(self):
+        self.runner._stamp_executor.shutdown(wait=True)
+        self.runner.data_logger.close()
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def set_schedule(self, *cycles) -> List[main_node_runner.ScheduledCycle]:
+        """Replaces the runner's schedule with the given (due, name, consensus, period) entries."""
+        schedule = list(cycles)
+        heapq.heapify(schedule)
+        self.runner._schedule = schedule
+        return schedule
+
+    def scheduled(self) -> List[tuple]:
+        """The (due, name) pairs currently on the heap, sorted."""
+        return sorted((due, name) for due, name, _, _ in self.runner._schedule)
+
+
+class TestAdvanceDeadline(unittest.TestCase):
+
+    advance = staticmethod(BlockchainNodeRunner._advance_deadline)
+
+    def test_on_time_cycle_keeps_its_cadence(self):
+        self.assertEqual(self.advance(100.0, 10.0, 100.0), 110.0)
+        # Running late within the period does not shift later deadlines
+        self.assertEqual(self.advance(100.0, 10.0, 109.5), 110.0)
+
+    def test_cycle_a_whole_period_behind_restarts_from_now(self):
+        self.assertEqual(self.advance(100.0, 10.0, 110.0), 120.0)
+        self.assertEqual(self.advance(100.0, 10.0, 1000.0), 1010.0)
+
+
+class TestRunDueCycles(RunnerTestCase):
+
+    def test_nothing_won_keeps_every_cycle_due(self):
+        # Both cycles are popped and neither wins: the heap empties mid-pass
+        self.set_schedule((0.0, "SDB", _no_winner, 1800.0), (0.0, "BTZ", _no_winner, 300.0))
+
+        self.runner._run_due_cycles(10.0)
+
+        self.assertEqual(self.scheduled(), [(0.0, "BTZ"), (0.0, "SDB")])
+        self.assertFalse(self.runner._pending_stamps)
+        self.assertEqual(self.runner._seconds_until_next_cycle(), CYCLE_RETRY_SECONDS)
+
+    def test_one_cycle_won_one_lost(self):
+        self.runner._create_genesis_block(0.0)
+        self.set_schedule((0.0, "SDB", _no_winner, 1800.0), (0.0, "BTZ", _winner("BTZCY-SYSTEM"), 300.0))
+
+        self.runner._run_due_cycles(10.0)
+        self.runner._pending_stamps[0].result()
+        self.runner._collect_finished_stamps()
+
+        # The winner moves on one period; the loser stays due and is retried
+        self.assertEqual(self.scheduled(), [(0.0, "SDB"), (300.0, "BTZ")])
+        self.assertEqual(self.runner.chain_height, 2)
+        self.assertEqual(self.runner._seconds_until_next_cycle(), CYCLE_RETRY_SECONDS)
+
+    def test_winner_is_stamped_when_a_later_cycle_fails(self):
+        self.runner._create_genesis_block(0.0)
+        self.set_schedule((0.0, "BTZ", _winner("BTZCY-SYSTEM"), 300.0), (5.0, "SDB", _broken, 1800.0))
+
+        with self.assertRaises(RuntimeError):
+            self.runner._run_due_cycles(10.0)
+        self.runner._pending_stamps[0].result()
+        self.runner._collect_finished_stamps()
+
+        self.assertEqual(self.scheduled(), [(5.0, "SDB"), (300.0, "BTZ")])
+        self.assertEqual(self.runner.chain_height, 2)
+
+    def test_due_cycles_share_the_wallet_node_list(self):
+        seen = []
+
+        def record(active_nodes):
+            seen.append(active_nodes)
+            return None
+
+        self.set_schedule((0.0, "SDB", record, 1800.0), (0.0, "BTZ", record, 300.0), (50.0, "LATE", record, 1.0))
+        with mock.patch.object(self.runner.wallet_handler, "get_all_active_addresses",
+                               wraps=self.runner.wallet_handler.get_all_active_addresses) as lookup:
+            self.runner._run_due_cycles(10.0)
+            self.runner._run_due_cycles(20.0)
+
+        # One lookup per pass, and the LATE cycle (never due) never ran
+        self.assertEqual(lookup.call_count, 2)
+        self.assertEqual(len(seen), 4)
+        self.assertTrue(all(nodes == self.runner.wallet_handler.get_all_active_addresses() for nodes in seen))
+
+
+class TestStampWorker(RunnerTestCase):
+
+    REWARD = {
+        "winner_address": "0xPACKET_LOAD_MASTER_C3D4",
+        "reward_type": "BTZCY-SYSTEM",
+        "reward_amount": 150,
+        "binary_transit_no": 4200,
+    }
+
+    def test_failed_stamp_is_retried(self):
+        self.runner._create_genesis_block(0.0)
+        engine = self.runner.stamping_engine
+        stamp = engine.stamp_new_block
+        attempts = []
+
+        def fail_once(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                raise IOError("disk full")
+            return stamp(**kwargs)
+
+        with mock.patch.object(engine, "stamp_new_block", side_effect=fail_once):
+            with self.assertLogs("main_node_runner", "ERROR"):
+                self.runner._submit_stamps([dict(self.REWARD)])
+                self.runner._pending_stamps[0].result()
+            # The failure surfaces on the scheduling thread, with the reward re-queued
+            with self.assertRaises(IOError):
+                self.runner._collect_finished_stamps()
+            self.assertEqual(self.runner.chain_height, 1)
+
+            self.runner._pending_stamps[0].result()
+            self.runner._collect_finished_stamps()
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(self.runner.chain_height, 2)
+        self.assertEqual(self.runner._complexity_ticks, 1)
+        self.assertFalse(self.runner._pending_stamps)
+
+
+class TestResume(RunnerTestCase):
+
+    def stamp_and_stop(self, rewards: int) -> None:
+        """Grows the chain by `rewards` blocks, then shuts the runner down as run_node does."""
+        self.runner._create_genesis_block(0.0)
+        self.runner._submit_stamps([_winner("BTZCY-SYSTEM")(("0xMINER",)) for _ in range(rewards)])
+        self.runner._stamp_executor.shutdown(wait=True)
+        self.runner._collect_finished_stamps()
+        self.runner._save_state()
+        self.runner.data_logger.close()
+
+    def restart(self) -> BlockchainNodeRunner:
+        """Replaces the runner with a fresh one on the same ledger files (torn down as usual)."""
+        previous = self.runner
+        self.runner = BlockchainNodeRunner()
+        return previous
+
+    def test_restart_resumes_chain_and_cycle_phase(self):
+        self.set_schedule((time.monotonic() + 120.0, "BTZ", _no_winner, 300.0),
+                          (time.monotonic() + 900.0, "SDB", _no_winner, 1800.0))
+        # Ticks carried over from earlier runs, so they differ from the height-based fallback
+        self.runner._complexity_ticks = 10
+        self.stamp_and_stop(3)
+        previous = self.restart()
+
+        now = time.monotonic()
+        self.assertTrue(self.runner._resume_chain(now))
+
+        self.assertEqual(self.runner.chain_height, 4)
+        self.assertEqual(self.runner.head(), previous.head())
+        self.assertEqual(list(self.runner.recent_blocks), list(previous.recent_blocks))
+        self.assertEqual(self.runner._complexity_ticks, 13)
+        for (due, name), (prev_due, prev_name) in zip(self.scheduled(), sorted(
+                (due, name) for due, name, _, _ in previous._schedule)):
+            self.assertEqual(name, prev_name)
+            self.assertAlmostEqual(due, prev_due, delta=0.5)
+
+        # New blocks extend the resumed chain
+        self.runner._submit_stamps([_winner("BTZCY-SYSTEM")(("0xMINER",))])
+        self.runner._pending_stamps[0].result()
+        self.runner._collect_finished_stamps()
+        self.assertEqual(self.runner.chain_height, 5)
+        self.runner.data_logger.flush()
+        tip = self.runner.data_logger.read_recent_blocks(1)[0]
+        self.assertEqual(tip["PREVIOUS_HASH"], previous.head().hardcover_cryption)
+
+    def test_overdue_cycle_runs_right_after_a_restart(self):
+        random.seed(7)
+        # A node booted at genesis and stopped at once: the real reward logic 
+        # gates start at boot, the cycles one period later
+        self.runner._create_genesis_block(time.monotonic())
+        self.runner._save_state()
+        self.runner.data_logger.close()
+        # ...and was left down for longer than a BTZ period
+        with open(main_node_runner.STATE_FILEPATH) as f:
+            state = json.load(f)
+        downtime = main_node_runner.BTZ_REWARD_CYCLE + 5.0
+        state["deadlines"] = {name: due - downtime for name, due in state["deadlines"].items()}
+        state["last_reward_times"] = {name: last - downtime for name, last in state["last_reward_times"].items()}
+        with open(main_node_runner.STATE_FILEPATH, 'w') as f:
+            json.dump(state, f)
+        self.restart()
+
+        now = time.monotonic()
+        self.assertTrue(self.runner._resume_chain(now))
+        self.runner._run_due_cycles(now)
+        self.runner._pending_stamps[0].result()
+        self.runner._collect_finished_stamps()
+
+        # BTZ won on its first pass instead of waiting out a period from boot
+        self.assertEqual(self.runner.chain_height, 2)
+        btz_due = dict((name, due) for due, name in self.scheduled())["BTZ"]
+        self.assertGreater(btz_due, now)
+        self.assertGreater(self.runner._seconds_until_next_cycle(), CYCLE_RETRY_SECONDS)
+
+    def test_restart_without_state_file_restarts_the_cycles(self):
+        self.stamp_and_stop(2)
+        os.remove(main_node_runner.STATE_FILEPATH)
+        self.restart()
+
+        now = time.monotonic()
+        self.assertTrue(self.runner._resume_chain(now))
+
+        self.assertEqual(self.runner.chain_height, 3)
+        self.assertEqual(self.runner._complexity_ticks, 2)
+        self.assertEqual(self.scheduled(), [(now + main_node_runner.BTZ_REWARD_CYCLE, "BTZ"),
+                                            (now + main_node_runner.SDB_REWARD_CYCLE, "SDB")])
+
+    def test_empty_ledger_is_not_resumed(self):
+        self.assertFalse(self.runner._resume_chain(time.monotonic()))
+        self.assertEqual(self.runner.chain_height, 0)
+
+
+class TestEndToEnd(RunnerTestCase):
+
+    def _open_time_gates(self):
+        """The reward logic keeps its own per-token clock; let it fire immediately."""
+        self.runner.consensus_manager.sdb_logic.last_reward_time = 0.0
+        self.runner.consensus_manager.btz_logic.last_reward_time = 0.0
+
+    def test_won_cycle_is_stamped_onto_the_chain(self):
+        random.seed(7)
+        self._open_time_gates()
+        self.runner._create_genesis_block(0.0)
+        btz = self.runner.consensus_manager.run_btz_consensus
+        self.set_schedule((0.0, "BTZ", btz, 300.0), (1000.0, "SDB", _no_winner, 1800.0))
+
+        self.runner._run_due_cycles(1.0)
+        self.runner._stamp_executor.shutdown(wait=True)
+        self.runner._collect_finished_stamps()
+
+        self.assertEqual(self.runner.chain_height, 2)
+        self.assertEqual(self.scheduled(), [(300.0, "BTZ"), (1000.0, "SDB")])
+        tip = self.runner.head()
+        self.assertEqual(tip.block_index, 2)
+
+        self.runner.data_logger.flush()
+        with open(self.runner.data_logger.JSONL_FILEPATH, 'rb') as f:
+            blocks = [json.loads(line) for line in f]
+        self.assertEqual([b["REWARD_CHAIN"] for b in blocks], ["GENESIS", "BTZCY-SYSTEM"])
+        self.assertEqual(blocks[1]["PREVIOUS_HASH"], blocks[0]["HARDCOVER_CRYPTION"])
+        self.assertEqual(blocks[1]["HARDCOVER_CRYPTION"], tip.hardcover_cryption)
+
+    def test_run_node_stamps_rewards_until_stopped(self):
+        random.seed(11)
+        self._open_time_gates()
+        self.runner.consensus_manager.btz_logic.BTZ_CYCLE_TIME_SECONDS = 0
+        # Short cycles, so a few BTZ rounds run within the test
+        with mock.patch.object(main_node_runner, "BTZ_REWARD_CYCLE", 0.05), \
+                mock.patch.object(main_node_runner, "SDB_REWARD_CYCLE", 3600):
+            node = threading.Thread(target=self.runner.run_node)
+            node.start()
+            deadline = time.monotonic() + 5.0
+            while self.runner.chain_height < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.runner.stop()
+            node.join(timeout=5.0)
+
+        self.assertFalse(node.is_alive())
+        self.assertGreaterEqual(self.runner.chain_height, 3)
+        self.assertEqual(self.runner._fail_backoff, main_node_runner.ERROR_BACKOFF_BASE_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for the verification PoW of TOKEN_2_BTZCY/ping_nmap_verifier.py.
+
+Run from the project root (the directory holding main_node_runner.py):
+    python -m unittest discover -s tests
+"""
+import hashlib
+import os
+import random
+import unittest
+
+from TOKEN_2_BTZCY.ping_nmap_verifier import PingNmapVerifier
+
+
+def _meets_target(digest: bytes, difficulty_target: str) -> bool:
+    """Applies PingNmapVerifier's digest-bit check for one digest."""
+    prefix_bytes, shift, expected = PingNmapVerifier._difficulty_mask(difficulty_target)
+    return int.from_bytes(digest[:prefix_bytes], 'big') >> shift == expected
+
+
+class TestDifficultyMask(unittest.TestCase):
+
+    def test_bit_check_agrees_with_the_hex_prefix_check(self):
+        rng = random.Random(99)
+        for trial in range(2000):
+            digest = hashlib.sha256(os.urandom(8)).digest()
+            # Targets taken from the digest itself (always met) or random (rarely met), odd and even lengths
+            length = rng.randrange(0, 7)
+            target = digest.hex()[:length] if trial % 2 else "".join(rng.choice("0123456789abcdef") for _ in range(length))
+            with self.subTest(target=target, digest=digest.hex()):
+                self.assertEqual(_meets_target(digest, target), digest.hex().startswith(target))
+
+
+class TestProofOfVerificationWork(unittest.TestCase):
+
+    def setUp(self):
+        self.verifier = PingNmapVerifier()
+
+    def reference_proof(self, raw_data: str) -> str:
+        """The first nonce whose hex digest starts with the target, searched the slow way."""
+        for nonce in range(self.verifier.MAX_VERIFICATION_NONCE + 1):
+            digest = hashlib.sha256(raw_data.encode('utf-8') + nonce.to_bytes(4, 'big')).hexdigest()
+            if digest.startswith(self.verifier.difficulty_target):
+                return digest
+        return f"NonceExceeded-{digest[:10]}"
+
+    def test_proof_is_the_first_digest_meeting_the_target(self):
+        for target in ("000", "00", "a", "f0f"):
+            self.verifier.difficulty_target = target
+            raw_data = f"0xNODE_ADDRESS-{target}-42.5ms"
+            with self.subTest(target=target):
+                proof = self.verifier._generate_proof_of_verification_work(raw_data)
+                self.assertTrue(proof.startswith(target))
+                self.assertEqual(proof, self.reference_proof(raw_data))
+
+    def test_unreachable_target_stops_at_the_nonce_limit(self):
+        self.verifier.difficulty_target = "0" * 12
+        raw_data = "0xNODE_ADDRESS-unreachable"
+        proof = self.verifier._generate_proof_of_verification_work(raw_data)
+        self.assertEqual(proof, self.reference_proof(raw_data))
+        self.assertTrue(proof.startswith("NonceExceeded-"))
+
+
+if __name__ == '__main__':
+    unittest.main()
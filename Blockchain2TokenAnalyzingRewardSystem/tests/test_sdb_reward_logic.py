@@ -0,0 +1,60 @@
+"""
+Tests for the PoFS seed match of TOKEN_1_SNIFFEE/sdb_reward_logic.py.
+
+Run from the project root (the directory holding main_node_runner.py):
+    python -m unittest discover -s tests
+"""
+import random
+import unittest
+from typing import Any, Dict, List, Optional
+
+from TOKEN_1_SNIFFEE.sdb_reward_logic import SDBRewardLogic
+
+
+def _linear_match(nodes: List[Dict[str, Any]], target_seed: str, depth: int) -> Optional[Dict[str, Any]]:
+    """Reference resolver: the first node, in aggregation order, whose proof starts with the seed prefix."""
+    prefix = target_seed[:depth]
+    return next((node for node in nodes if node["data_proof_hash"].startswith(prefix)), None)
+
+
+class TestSeedMatch(unittest.TestCase):
+
+    def setUp(self):
+        self.logic = SDBRewardLogic()
+        self.depth = self.logic.MATCH_DIFFICULTY_LENGTH
+        self.rng = random.Random(1234)
+
+    def random_hex(self, length: int, alphabet: str = "01") -> str:
+        # A two-letter alphabet makes prefix collisions (and so matches) common
+        return "".join(self.rng.choice(alphabet) for _ in range(length))
+
+    def nodes(self, count: int, hash_length: int) -> List[Dict[str, Any]]:
+        return [
+            {"node_address": f"0xNODE_{index}", "data_proof_hash": self.random_hex(hash_length)}
+            for index in range(count)
+        ]
+
+    def match(self, nodes: List[Dict[str, Any]], target_seed: str) -> Optional[Dict[str, Any]]:
+        return self.logic._find_seed_match_winner(self.logic._build_proof_trie(nodes), target_seed)
+
+    def test_trie_agrees_with_a_linear_scan(self):
+        for trial in range(300):
+            # Includes proofs and seeds shorter than the match depth
+            nodes = self.nodes(self.rng.randrange(0, 12), self.rng.choice([3, self.depth, 64]))
+            target_seed = self.random_hex(self.rng.choice([2, self.depth, 64]))
+            with self.subTest(trial=trial, target_seed=target_seed):
+                self.assertIs(self.match(nodes, target_seed), _linear_match(nodes, target_seed, self.depth))
+
+    def test_first_node_sharing_the_prefix_wins(self):
+        nodes = [
+            {"node_address": "0xA", "data_proof_hash": "abcd9" + "0" * 59},
+            {"node_address": "0xB", "data_proof_hash": "abcde" + "1" * 59},
+            {"node_address": "0xC", "data_proof_hash": "abcde" + "2" * 59},
+        ]
+        self.assertIs(self.match(nodes, "abcdeffff"), nodes[1])
+        self.assertIsNone(self.match(nodes, "abcdf"))
+        self.assertIsNone(self.match([], "abcde"))
+
+
+if __name__ == '__main__':
+    unittest.main()
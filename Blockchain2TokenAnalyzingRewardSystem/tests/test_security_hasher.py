@@ -0,0 +1,42 @@
+"""
+Tests for the canonical block encoding of TOKEN_1_SNIFFEE/security_hasher.py.
+
+Run from the project root (the directory holding main_node_runner.py):
+    python -m unittest discover -s tests
+"""
+import unittest
+
+from TOKEN_1_SNIFFEE.security_hasher import SecurityHasher, _encode_canonical_value
+
+
+class TestCanonicalEncoding(unittest.TestCase):
+
+    def test_every_type_has_its_own_encoding(self):
+        values = [None, True, 1, 0, False, 1.0, "1", "True", 2 ** 64, str(2 ** 64), -(2 ** 70), ""]
+        encodings = [_encode_canonical_value(v) for v in values]
+        self.assertEqual(len(set(encodings)), len(values))
+
+    def test_int64_boundaries(self):
+        for value in (2 ** 63 - 1, -(2 ** 63), 2 ** 63, -(2 ** 63) - 1, 255, -256):
+            with self.subTest(value=value):
+                data = _encode_canonical_value(value)
+                if data[:1] == b'I':
+                    self.assertEqual(int.from_bytes(data[5:], 'little', signed=True), value)
+                else:
+                    self.assertEqual(data[:1], b'i')
+
+    def test_unsupported_types_are_rejected(self):
+        for value in ([1], {"a": 1}, b"raw", (1, 2), object()):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    _encode_canonical_value(value)
+
+    def test_hash_ignores_dict_order_and_non_canonical_keys(self):
+        hasher = SecurityHasher()
+        block = {name: index for index, name in enumerate(hasher.CANONICAL_BLOCK_FIELDS)}
+        reordered = dict(reversed(list(block.items())), PROOF_DATA={"unsigned": True})
+        self.assertEqual(hasher.canonical_sha256_hash(block), hasher.canonical_sha256_hash(reordered))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests for the signature checks of UTILITIES_AND_SECURITY/wallet_address_handler.py.
+
+Run from the project root (the directory holding main_node_runner.py):
+    python -m unittest discover -s tests
+"""
+import importlib
+import unittest
+
+# The package directory name starts with a space; importlib resolves it by its exact name
+WalletAddressHandler = importlib.import_module(" UTILITIES_AND_SECURITY.wallet_address_handler").WalletAddressHandler
+
+
+class TestVerifyAddressSignature(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = WalletAddressHandler()
+        self.address = self.handler.get_all_active_addresses()[0]
+        self.payload = f"ACCEPTANCE-ETHICAL_CHOICE_12345-{self.address}"
+
+    def valid_signature(self, tail: str = "_0123456789abcdef") -> str:
+        prefix = self.handler._expected_prefix(self.payload, self.handler.SIGNATURE_PREFIX_LENGTH)
+        return prefix.decode() + tail
+
+    def test_matching_prefix_is_accepted(self):
+        self.assertTrue(self.handler.verify_address_signature(self.address, self.payload, self.valid_signature()))
+
+    def test_non_ascii_tail_does_not_affect_a_matching_prefix(self):
+        signature = self.valid_signature("_é€0123456789")
+        self.assertTrue(self.handler.verify_address_signature(self.address, self.payload, signature))
+
+    def test_non_ascii_prefix_is_rejected_not_raised(self):
+        for signature in ("ééééé_0123456789", "\ud800abcd_0123456789"):
+            with self.subTest(signature=signature):
+                self.assertFalse(self.handler.verify_address_signature(self.address, self.payload, signature))
+
+    def test_unknown_address_is_rejected(self):
+        self.assertFalse(self.handler.verify_address_signature("0xUNKNOWN", self.payload, self.valid_signature()))
+
+
+if __name__ == '__main__':
+    unittest.main()